@@ -3,7 +3,11 @@
 import asyncio
 import sys
 from datetime import datetime
+from pathlib import Path
 
+from open_deep_research.knowledge_graph import close_knowledge_graph_clients
+from open_deep_research.tools.fmp.tools import close_fmp_client
+from open_deep_research.utils import close_mcp_session
 from rich.console import Console
 
 from src.configuration import Configuration
@@ -21,27 +25,36 @@ async def main() -> None:
   try:
     config = Configuration()
 
-    # Convert enum to string value for serialization
-    config_dict = config.model_dump()
-    if "search_api" in config_dict:
-      config_dict["search_api"] = (
-        config_dict["search_api"].value
-        if hasattr(config_dict["search_api"], "value")
-        else config_dict["search_api"]
-      )
+    # JSON mode emits enum values directly, e.g. for search_api
+    config_dict = config.model_dump(mode="json")
 
-    result = await deep_researcher.ainvoke(
+    # Stream node updates to report progress and pick up the report as soon
+    # as the final report node finishes
+    final_report = None
+    async for update in deep_researcher.astream(
       {"messages": [{"role": "user", "content": query}]},
       config={"configurable": config_dict},
-    )
+      stream_mode="updates",
+    ):
+      for node_name, node_update in update.items():
+        console.print(f"Completed step: {node_name}")
+        if node_name == "final_report_generation" and node_update:
+          final_report = node_update["final_report"]
+
+    if final_report is None:
+      console.print("❌ Error during research: no final report was produced")
+      sys.exit(1)
 
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"research_report_{timestamp}.md"
 
-    # Save report
-    with open(filename, "w", encoding="utf-8") as f:
-      f.write(result["final_report"])
+    # Save report without blocking the event loop
+    await asyncio.to_thread(
+      Path(filename).write_text,
+      final_report,
+      encoding="utf-8",
+    )
 
     console.print(f"✅ Research completed! Report saved to: {filename}")
 
@@ -49,6 +62,14 @@ async def main() -> None:
     console.print(f"❌ Error during research: {e!s}")
     sys.exit(1)
 
+  finally:
+    # Release pooled connections before the event loop closes
+    await asyncio.gather(
+      close_fmp_client(),
+      close_mcp_session(),
+      close_knowledge_graph_clients(),
+    )
+
 
 if __name__ == "__main__":
   asyncio.run(main())
@@ -55,6 +55,18 @@ class Neo4jConfig(BaseModel):
     default="neo4j",
     description="Neo4j database name",
   )
+  max_connection_pool_size: int = Field(
+    default=50,
+    description="Maximum number of pooled connections held by the Neo4j driver",
+  )
+  connection_acquisition_timeout: float = Field(
+    default=30.0,
+    description="Seconds to wait for a pooled Neo4j connection before failing",
+  )
+  max_connection_lifetime: int = Field(
+    default=3600,
+    description="Seconds after which a pooled Neo4j connection is replaced",
+  )
 
 
 class Configuration(BaseModel):
@@ -96,6 +108,45 @@ class Configuration(BaseModel):
       },
     },
   )
+  max_concurrent_normalizations: int = Field(
+    default=32,
+    metadata={
+      "x_oap_ui_config": {
+        "type": "slider",
+        "default": 32,
+        "min": 1,
+        "max": 64,
+        "step": 1,
+        "description": "Maximum number of concept normalization LLM calls to run concurrently when extracting knowledge into the knowledge graph.",
+      },
+    },
+  )
+  max_concurrent_extractions: int = Field(
+    default=16,
+    metadata={
+      "x_oap_ui_config": {
+        "type": "slider",
+        "default": 16,
+        "min": 1,
+        "max": 32,
+        "step": 1,
+        "description": "Maximum number of knowledge extraction LLM calls to run concurrently when the supervisor extracts several research results at once.",
+      },
+    },
+  )
+  max_concurrent_summaries: int = Field(
+    default=8,
+    metadata={
+      "x_oap_ui_config": {
+        "type": "slider",
+        "default": 8,
+        "min": 1,
+        "max": 32,
+        "step": 1,
+        "description": "Maximum number of webpage summarization LLM calls to run concurrently for a single search.",
+      },
+    },
+  )
   # Research Configuration
   search_api: SearchAPI = Field(
     default=SearchAPI.TAVILY,
@@ -178,6 +229,18 @@ class Configuration(BaseModel):
       },
     },
   )
+  min_extraction_content_length: int = Field(
+    default=500,
+    metadata={
+      "x_oap_ui_config": {
+        "type": "number",
+        "default": 500,
+        "min": 0,
+        "max": 10000,
+        "description": "Minimum character length of research content before it is sent for knowledge extraction. Shorter content is skipped without an LLM call.",
+      },
+    },
+  )
   research_model: str = Field(
     default="openai:gpt-4.1",
     metadata={
@@ -379,12 +379,15 @@ async def supervisor_tools(
     if tool_call["name"] == "ExtractKnowledge"
   ]
 
-  for tool_call in extract_knowledge_calls:
+  if extract_knowledge_calls:
     try:
       # Import knowledge extraction here to avoid circular imports
-      from open_deep_research.knowledge_extraction import create_knowledge_integrator
+      from open_deep_research.knowledge_extraction import (
+        ProcessingStatus,
+        create_knowledge_integrator,
+      )
 
-      # Get or create knowledge integrator
+      # Per-turn integrator over the process-wide Neo4j client and its pool
       kg_integrator = await create_knowledge_integrator(configurable)
 
       if kg_integrator:
@@ -395,38 +398,50 @@ async def supervisor_tools(
           initial_query = "Research Query"  # Could extract from messages
           await kg_integrator.initialize_research_session(initial_query, research_brief)
 
-        # Process knowledge extraction
-        research_content = tool_call["args"]["research_content"]
-        research_context = tool_call["args"]["research_context"]
-
-        success = await kg_integrator.process_research_results(
-          research_content,
-          research_context,
-          {"title": research_context, "type": "research_extraction"},
+        # Process all knowledge extractions together so they share the prompt prefix
+        results = await kg_integrator.process_research_results_batch(
+          [
+            (
+              tool_call["args"]["research_content"],
+              tool_call["args"]["research_context"],
+              {
+                "title": tool_call["args"]["research_context"],
+                "type": "research_extraction",
+              },
+            )
+            for tool_call in extract_knowledge_calls
+          ],
           config,
         )
 
-        result_message = (
-          "Knowledge extracted and stored in knowledge graph successfully."
-          if success
-          else "Failed to extract knowledge to knowledge graph."
-        )
-        await kg_integrator.close()
+        status_messages = {
+          ProcessingStatus.STORED: (
+            "Knowledge extracted and stored in knowledge graph successfully."
+          ),
+          ProcessingStatus.SKIPPED: (
+            "Research content too short for knowledge extraction - skipped."
+          ),
+          ProcessingStatus.FAILED: "Failed to extract knowledge to knowledge graph.",
+        }
+        result_messages = [status_messages[status] for status in results]
       else:
-        result_message = "Knowledge graph storage is disabled - extraction skipped."
+        result_messages = [
+          "Knowledge graph storage is disabled - extraction skipped.",
+        ] * len(extract_knowledge_calls)
 
-      all_tool_messages.append(
-        ToolMessage(
-          content=result_message,
-          name="ExtractKnowledge",
-          tool_call_id=tool_call["id"],
-        ),
+    except Exception as e:
+      result_messages = [f"Error extracting knowledge: {e!s}"] * len(
+        extract_knowledge_calls,
       )
 
-    except Exception as e:
+    for tool_call, result_message in zip(
+      extract_knowledge_calls,
+      result_messages,
+      strict=True,
+    ):
       all_tool_messages.append(
         ToolMessage(
-          content=f"Error extracting knowledge: {e!s}",
+          content=result_message,
           name="ExtractKnowledge",
           tool_call_id=tool_call["id"],
         ),
@@ -1,11 +1,24 @@
 """Helper functions for the Deep Research agent."""
 
+import functools
 import os
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 
 from langchain_core.runnables import RunnableConfig
 
+# Map providers to environment variable names
+_PROVIDER_KEY_MAPPING = MappingProxyType(
+  {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "groq": "GROQ_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+  },
+)
+
 
 def get_today_str() -> str:
   """Get today's date as a formatted string."""
@@ -17,20 +30,14 @@ def get_api_key_for_model(
   config: RunnableConfig = None,
 ) -> Optional[str]:
   """Get API key for a specific model provider."""
-  # Extract provider from model name (e.g., "openai:gpt-4" -> "openai")
-  provider = model_name.split(":")[0] if ":" in model_name else model_name
+  env_var = _api_key_env_var(model_name)
+  # Read on every call, so keys set later in the process are picked up
+  return os.getenv(env_var) if env_var else None
 
-  # Map providers to environment variable names
-  provider_key_mapping = {
-    "openai": "OPENAI_API_KEY",
-    "anthropic": "ANTHROPIC_API_KEY",
-    "google": "GOOGLE_API_KEY",
-    "groq": "GROQ_API_KEY",
-    "deepseek": "DEEPSEEK_API_KEY",
-  }
-
-  env_var = provider_key_mapping.get(provider.lower())
-  if env_var:
-    return os.getenv(env_var)
 
-  return None
+@functools.lru_cache(maxsize=32)
+def _api_key_env_var(model_name: str) -> Optional[str]:
+  """Resolve and cache the environment variable holding a model's API key."""
+  # Extract provider from model name (e.g., "openai:gpt-4" -> "openai")
+  provider = model_name.split(":")[0] if ":" in model_name else model_name
+  return _PROVIDER_KEY_MAPPING.get(provider.lower())
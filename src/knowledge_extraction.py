@@ -1,9 +1,16 @@
 """LLM-based knowledge extraction and concept normalization for the research supervisor."""
 
+import asyncio
+import heapq
 import logging
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from difflib import SequenceMatcher
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
+import ahocorasick
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
@@ -19,10 +26,30 @@ from open_deep_research.knowledge_graph import (
   SourceType,
   generate_id,
 )
+from open_deep_research.prompts import knowledge_extraction_prompt
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Below this many concepts a plain substring scan beats building an automaton
+AHO_CORASICK_MIN_CONCEPTS = 8
+
+# Limit research content sent for extraction to avoid token limits
+MAX_EXTRACTION_CONTENT_CHARS = 8000
+
+# Number of most similar existing concepts shown to the normalization LLM
+MAX_NORMALIZATION_CANDIDATES = 10
+
+# Case-insensitive markers used to classify sources without lowercasing copies
+_ARXIV_URL_PATTERN = re.compile(r"arxiv", re.IGNORECASE)
+_VIDEO_URL_PATTERN = re.compile(r"youtube", re.IGNORECASE)
+_RESEARCH_TITLE_PATTERN = re.compile(r"research", re.IGNORECASE)
+
+# LLM concept type label -> ConceptType
+_CONCEPT_TYPE_MAP = MappingProxyType(
+  {concept_type.value: concept_type for concept_type in ConceptType},
+)
+
 
 # Structured outputs for LLM-based extraction
 class ExtractedClaim(BaseModel):
@@ -85,6 +112,71 @@ class ResearchExtraction(BaseModel):
   key_insights: List[str] = Field(description="High-level insights or conclusions")
 
 
+class ProcessingStatus(Enum):
+  """Outcome of processing one research result into the knowledge graph."""
+
+  STORED = "stored"
+  # Content too short to extract from, nothing was written
+  SKIPPED = "skipped"
+  FAILED = "failed"
+
+
+def _build_concept_automaton(
+  lowered_concepts: List[Tuple[str, str]],
+) -> Optional[ahocorasick.Automaton]:
+  """Build an Aho-Corasick automaton over lowercased concept names.
+
+  Returns None when there are too few concepts for the automaton to pay off.
+  """
+  if len(lowered_concepts) < AHO_CORASICK_MIN_CONCEPTS:
+    return None
+
+  canonical_by_name: Dict[str, List[str]] = {}
+  for name_lower, canonical_name in lowered_concepts:
+    if name_lower:
+      canonical_by_name.setdefault(name_lower, []).append(canonical_name)
+
+  if not canonical_by_name:
+    return None
+
+  automaton = ahocorasick.Automaton()
+  for name, canonical_names in canonical_by_name.items():
+    automaton.add_word(name, canonical_names)
+  automaton.make_automaton()
+  return automaton
+
+
+def _top_candidate_concepts(
+  new_concept: ExtractedConcept,
+  existing_concepts: List[str],
+  k: int = MAX_NORMALIZATION_CANDIDATES,
+) -> List[str]:
+  """Rank existing concept names by lexical similarity to a new concept.
+
+  Scores by shared words with the concept name and aliases first, then by
+  character-level similarity to the name, and keeps the top k.
+  """
+  if len(existing_concepts) <= k:
+    return existing_concepts
+
+  new_name = new_concept.name.lower()
+  new_words = set(new_name.split())
+  for alias in new_concept.aliases:
+    new_words.update(alias.lower().split())
+
+  def score(existing: str) -> Tuple[int, float]:
+    existing_name = existing.lower()
+    shared_words = len(new_words.intersection(existing_name.split()))
+    return shared_words, SequenceMatcher(None, new_name, existing_name).ratio()
+
+  return heapq.nlargest(k, existing_concepts, key=score)
+
+
+def _concept_cache_key(name: str) -> str:
+  """Normalize a concept name for case- and whitespace-insensitive cache lookups."""
+  return " ".join(name.lower().split())
+
+
 class KnowledgeExtractor:
   """LLM-based knowledge extraction service for the research supervisor."""
 
@@ -94,41 +186,40 @@ class KnowledgeExtractor:
     self.model = init_chat_model(
       configurable_fields=("model", "max_tokens", "api_key"),
     )
+    # Number of extractions short-circuited for content below the minimum length
+    self.skipped_extractions = 0
+    # Shared by every extraction call so providers can cache the prompt prefix
+    self.extraction_system_message = SystemMessage(
+      content="You are an expert research analyst specializing in knowledge extraction.",
+    )
 
   async def extract_knowledge_from_research(
     self,
     research_content: str,
     research_topic: str,
     config: RunnableConfig,
-  ) -> ResearchExtraction:
-    """Extract claims and concepts from research content using LLM."""
-    extraction_prompt = f"""You are a research analyst tasked with extracting key claims and concepts from research content.
-
-RESEARCH TOPIC: {research_topic}
-
-RESEARCH CONTENT:
-{research_content[:8000]}  # Limit content to avoid token limits
-
-Your task:
-1. Extract 3-7 key CLAIMS - factual statements that can be verified
-2. Extract 5-12 CONCEPTS - important entities, topics, or ideas mentioned
-3. Provide 2-4 high-level INSIGHTS or conclusions
-
-Guidelines for CLAIMS:
-- Must be specific and factual
-- Should be verifiable from the source material
-- Include direct quotes when possible
-- Avoid opinions or speculation
-- Focus on novel or important information
-
-Guidelines for CONCEPTS:
-- Include people, organizations, technologies, topics, locations, events
-- Use canonical names (e.g., "Artificial Intelligence" not "AI")
-- Provide clear, brief descriptions
-- List common aliases or synonyms
-- Rate importance based on relevance to research topic
+  ) -> Optional[ResearchExtraction]:
+    """Extract claims and concepts from research content using LLM.
+
+    Returns:
+        The extraction, or None if the content is too short to extract from
+    """
+    # Content this short yields nothing worth extracting, skip the LLM call
+    if len(research_content.strip()) < self.config.min_extraction_content_length:
+      self.skipped_extractions += 1
+      logger.info(
+        "Skipped knowledge extraction for '%s': content shorter than %s characters "
+        "(%s skipped so far)",
+        research_topic,
+        self.config.min_extraction_content_length,
+        self.skipped_extractions,
+      )
+      return None
 
-Be precise and focus on quality over quantity."""
+    extraction_prompt = knowledge_extraction_prompt.format(
+      research_topic=research_topic,
+      research_content=research_content[:MAX_EXTRACTION_CONTENT_CHARS],
+    )
 
     model_config = {
       "model": self.config.research_model,
@@ -143,9 +234,7 @@ Be precise and focus on quality over quantity."""
     try:
       result = await extraction_model.ainvoke(
         [
-          SystemMessage(
-            content="You are an expert research analyst specializing in knowledge extraction.",
-          ),
+          self.extraction_system_message,
           HumanMessage(content=extraction_prompt),
         ],
       )
@@ -160,6 +249,38 @@ Be precise and focus on quality over quantity."""
       # Return empty result on failure
       return ResearchExtraction(claims=[], concepts=[], key_insights=[])
 
+  async def extract_knowledge_from_research_batch(
+    self,
+    items: List[Tuple[str, str]],
+    config: RunnableConfig,
+  ) -> List[Optional[ResearchExtraction]]:
+    """Extract knowledge from several (research_content, research_topic) pairs.
+
+    Each item is a separate single-item request sharing the same system prompt,
+    so providers can reuse the cached prompt prefix across the batch.
+    """
+    semaphore = asyncio.Semaphore(self.config.max_concurrent_extractions)
+
+    async def extract(
+      research_content: str,
+      research_topic: str,
+    ) -> Optional[ResearchExtraction]:
+      async with semaphore:
+        return await self.extract_knowledge_from_research(
+          research_content,
+          research_topic,
+          config,
+        )
+
+    return list(
+      await asyncio.gather(
+        *(
+          extract(research_content, research_topic)
+          for research_content, research_topic in items
+        ),
+      ),
+    )
+
   async def normalize_concept(
     self,
     new_concept: ExtractedConcept,
@@ -174,6 +295,9 @@ Be precise and focus on quality over quantity."""
         explanation="No existing concepts to compare against",
       )
 
+    # Only show the existing concepts most similar to the new one
+    candidate_concepts = _top_candidate_concepts(new_concept, existing_concepts)
+
     normalization_prompt = f"""You are tasked with concept normalization in a knowledge graph.
 
 NEW CONCEPT:
@@ -183,7 +307,7 @@ Description: {new_concept.description}
 Aliases: {new_concept.aliases}
 
 EXISTING CONCEPTS:
-{chr(10).join(f"- {concept}" for concept in existing_concepts[:20])}
+{chr(10).join(f"- {concept}" for concept in candidate_concepts)}
 
 Task: Determine if the NEW CONCEPT should be merged with any EXISTING CONCEPT.
 
@@ -249,7 +373,14 @@ class KnowledgeGraphIntegrator:
     self.kg_client = kg_client
     self.extractor = extractor
     self.current_agent_run_id: Optional[str] = None
-    self.concept_cache: Dict[str, str] = {}  # concept_name -> canonical_name
+    # normalized concept name or alias -> canonical_name
+    self.concept_cache: Dict[str, str] = {}
+    # Each normalization is its own single-concept LLM call; a shared semaphore
+    # bounds how many run at once across all extractions being processed, so one
+    # slow call only holds up its own slot rather than a whole batch
+    self.normalization_semaphore = asyncio.Semaphore(
+      extractor.config.max_concurrent_normalizations,
+    )
 
   async def initialize_research_session(
     self,
@@ -268,11 +399,13 @@ class KnowledgeGraphIntegrator:
         metadata={"research_brief": research_brief},
       )
 
-      success = await self.kg_client.store_agent_run(agent_run)
+      # Load existing concepts for normalization while the run is stored
+      success, _ = await asyncio.gather(
+        self.kg_client.store_agent_run(agent_run),
+        self._load_concept_cache(),
+      )
       if success:
         self.current_agent_run_id = agent_run.id
-        # Load existing concepts for normalization
-        await self._load_concept_cache()
         logger.info(f"Initialized knowledge graph session: {agent_run.id}")
         return agent_run.id
 
@@ -287,125 +420,283 @@ class KnowledgeGraphIntegrator:
     research_topic: str,
     source_metadata: Dict[str, Any],
     config: RunnableConfig,
-  ) -> bool:
+  ) -> ProcessingStatus:
     """Process research results and store in knowledge graph."""
-    if not self.kg_client or not self.current_agent_run_id:
-      return False
+    results = await self.process_research_results_batch(
+      [(research_content, research_topic, source_metadata)],
+      config,
+    )
+    return results[0]
 
-    try:
-      # Extract knowledge using LLM
-      extraction = await self.extractor.extract_knowledge_from_research(
-        research_content,
-        research_topic,
-        config,
+  async def process_research_results_batch(
+    self,
+    items: List[Tuple[str, str, Dict[str, Any]]],
+    config: RunnableConfig,
+  ) -> List[ProcessingStatus]:
+    """Process several research results, storing them in a single transaction.
+
+    Args:
+        items: (research_content, research_topic, source_metadata) tuples
+        config: Runtime configuration
+
+    Returns:
+        Processing status for each item, in the same order
+    """
+    if not self.kg_client or not self.current_agent_run_id:
+      return [ProcessingStatus.FAILED] * len(items)
+
+    # Extract knowledge using LLM, issuing all extractions together
+    extractions = await self.extractor.extract_knowledge_from_research_batch(
+      [
+        (research_content, research_topic)
+        for research_content, research_topic, _ in items
+      ],
+      config,
+    )
+    statuses = [
+      ProcessingStatus.SKIPPED if extraction is None else ProcessingStatus.FAILED
+      for extraction in extractions
+    ]
+
+    # Skipped content gets no source, so it costs no graph write
+    extracted = [
+      (index, extraction, self._create_source(research_topic, source_metadata))
+      for index, (extraction, (_, research_topic, source_metadata)) in enumerate(
+        zip(extractions, items, strict=True),
       )
+      if extraction is not None
+    ]
+    if not extracted:
+      return statuses
+
+    # Cache entries for concepts normalized in this batch, applied only once the
+    # batch is stored so a rolled back write does not leave them behind
+    pending_cache: Dict[str, str] = {}
+    built = await asyncio.gather(
+      *(
+        self._build_extraction_nodes(extraction, source, config, pending_cache)
+        for _, extraction, source in extracted
+      ),
+    )
 
-      # Create source node
-      source = Source(
-        id=generate_id(),
-        url=source_metadata.get("url"),
-        title=source_metadata.get("title", research_topic),
-        author=source_metadata.get("author"),
-        source_type=self._determine_source_type(source_metadata),
-        metadata=source_metadata,
+    # Items whose nodes could not be built are left out of the write
+    stored_indices = []
+    stored_sources = []
+    concept_nodes: List[Concept] = []
+    claim_nodes: List[Claim] = []
+    mentions: Dict[str, List[str]] = {}
+    for (index, _, source), nodes in zip(extracted, built, strict=True):
+      if nodes is None:
+        continue
+      stored_indices.append(index)
+      stored_sources.append(source)
+      concept_nodes.extend(nodes[0])
+      claim_nodes.extend(nodes[1])
+      mentions.update(nodes[2])
+
+    if not stored_sources:
+      return statuses
+
+    stored = await self.kg_client.store_research_result(
+      self.current_agent_run_id,
+      stored_sources,
+      concept_nodes,
+      claim_nodes,
+      mentions,
+    )
+    if stored:
+      for key, canonical_name in pending_cache.items():
+        self.concept_cache.setdefault(key, canonical_name)
+      for index in stored_indices:
+        statuses[index] = ProcessingStatus.STORED
+      logger.info(
+        f"Processed research: {len(stored_sources)} sources, {len(claim_nodes)} claims, "
+        f"{len(concept_nodes)} new concepts",
       )
+    return statuses
+
+  def _create_source(
+    self,
+    research_topic: str,
+    source_metadata: Dict[str, Any],
+  ) -> Source:
+    """Create the source node for a piece of research content."""
+    return Source(
+      id=generate_id(),
+      url=source_metadata.get("url"),
+      title=source_metadata.get("title", research_topic),
+      author=source_metadata.get("author"),
+      source_type=self._determine_source_type(source_metadata),
+      metadata=source_metadata,
+    )
 
-      await self.kg_client.store_source(source)
+  async def _build_extraction_nodes(
+    self,
+    extraction: ResearchExtraction,
+    source: Source,
+    config: RunnableConfig,
+    pending_cache: Dict[str, str],
+  ) -> Optional[Tuple[List[Concept], List[Claim], Dict[str, List[str]]]]:
+    """Normalize an extraction's concepts and build its graph nodes.
+
+    Returns:
+        New concepts, claims and claim id to concept name mentions, or None
+        if the extraction could not be processed
+    """
+    try:
+      # Normalize concepts, collecting new ones for a single bulk write
+      normalizations = await asyncio.gather(
+        *(
+          self._normalize_concept(concept, config, pending_cache)
+          for concept in extraction.concepts
+        ),
+      )
 
-      # Process concepts with normalization
       normalized_concepts = {}
-      for concept in extraction.concepts:
-        canonical_name = await self._normalize_and_store_concept(concept, config)
+      concept_nodes = []
+      for concept, (canonical_name, concept_node) in zip(
+        extraction.concepts,
+        normalizations,
+        strict=True,
+      ):
         normalized_concepts[concept.name] = canonical_name
-
-      # Process claims and link to concepts
+        if concept_node:
+          concept_nodes.append(concept_node)
+
+      # Build claim nodes and their concept links, lowercasing names only once
+      lowered_concepts = [
+        (original_name.lower(), canonical_name)
+        for original_name, canonical_name in normalized_concepts.items()
+      ]
+      concept_automaton = _build_concept_automaton(lowered_concepts)
+      claim_nodes = []
+      mentions: Dict[str, List[str]] = {}
+      extracted_at = datetime.now()
       for claim in extraction.claims:
         claim_node = Claim(
           id=generate_id(),
           text=claim.claim_text,
           quote=claim.quote,
           confidence_score=claim.confidence,
-          timestamp=datetime.now(),
+          timestamp=extracted_at,
           source_id=source.id,
         )
-
-        await self.kg_client.store_claim(claim_node, self.current_agent_run_id)
+        claim_nodes.append(claim_node)
 
         # Link claim to relevant concepts
         relevant_concepts = self._find_relevant_concepts(
           claim.claim_text,
-          normalized_concepts,
+          lowered_concepts,
+          concept_automaton,
         )
         if relevant_concepts:
-          await self.kg_client.link_claim_to_concepts(claim_node.id, relevant_concepts)
+          mentions[claim_node.id] = relevant_concepts
 
-      logger.info(
-        f"Processed research: {len(extraction.claims)} claims, {len(extraction.concepts)} concepts",
-      )
-      return True
+      return concept_nodes, claim_nodes, mentions
 
     except Exception as e:
       logger.error(f"Error processing research results: {e}")
-      return False
+      return None
 
-  async def _normalize_and_store_concept(
+  async def _normalize_concept(
     self,
     concept: ExtractedConcept,
     config: RunnableConfig,
-  ) -> str:
-    """Normalize concept against existing ones and store."""
-    if concept.name in self.concept_cache:
-      return self.concept_cache[concept.name]
-
-    # Get existing concepts for normalization
-    existing_concepts = list(self.concept_cache.keys())
-
-    # Use LLM to check for similar concepts
-    normalization = await self.extractor.normalize_concept(
-      concept,
-      existing_concepts,
-      config,
-    )
+    pending_cache: Dict[str, str],
+  ) -> Tuple[str, Optional[Concept]]:
+    """Normalize concept against existing ones.
+
+    New cache entries go to pending_cache, which the caller applies to the
+    concept cache once the batch has been stored.
+
+    Returns:
+        The canonical name and, for concepts not seen before, the node to store
+    """
+    # Exact match on the name or any alias skips the LLM call entirely
+    cached_name = self._lookup_cached_concept(concept, pending_cache)
+    if cached_name:
+      return cached_name, None
+
+    async with self.normalization_semaphore:
+      # Concepts normalized while waiting for a slot may already cover this one
+      cached_name = self._lookup_cached_concept(concept, pending_cache)
+      if cached_name:
+        return cached_name, None
+
+      # Get existing canonical concepts for normalization
+      existing_concepts = list(
+        dict.fromkeys((*self.concept_cache.values(), *pending_cache.values())),
+      )
+
+      # Use LLM to check for similar concepts
+      normalization = await self.extractor.normalize_concept(
+        concept,
+        existing_concepts,
+        config,
+      )
 
     canonical_name = normalization.canonical_name
+    concept_node = None
 
     if not normalization.is_similar:
-      # Store new concept
+      # New concept, stored in bulk by the caller
       concept_type = self._convert_concept_type(concept.type)
+      aliases = list(concept.aliases)
+      if concept.name != canonical_name:
+        aliases.append(concept.name)
       concept_node = Concept(
         id=generate_id(),
         name=canonical_name,
         concept_type=concept_type,
-        aliases=concept.aliases + [concept.name]
-        if concept.name != canonical_name
-        else concept.aliases,
+        aliases=aliases,
         description=concept.description,
       )
 
-      await self.kg_client.store_concept(concept_node)
-
-    # Update cache
-    self.concept_cache[concept.name] = canonical_name
+    # Update cache for the name, its aliases and the canonical name itself
+    for name in (concept.name, canonical_name, *concept.aliases):
+      key = _concept_cache_key(name)
+      if key not in self.concept_cache:
+        pending_cache.setdefault(key, canonical_name)
     logger.info(
       f"Normalized concept '{concept.name}' -> '{canonical_name}' ({normalization.explanation})",
     )
 
-    return canonical_name
+    return canonical_name, concept_node
+
+  def _lookup_cached_concept(
+    self,
+    concept: ExtractedConcept,
+    pending_cache: Dict[str, str],
+  ) -> Optional[str]:
+    """Return the cached canonical name for a concept name or alias, if any."""
+    for name in (concept.name, *concept.aliases):
+      key = _concept_cache_key(name)
+      canonical_name = self.concept_cache.get(key) or pending_cache.get(key)
+      if canonical_name:
+        return canonical_name
+    return None
 
   async def _load_concept_cache(self):
-    """Load existing concepts for normalization."""
-    # This would query existing concepts from the database
-    # For now, we'll start with an empty cache and build it during the session
+    """Load existing concepts and their aliases for normalization."""
     self.concept_cache = {}
+    if not self.kg_client:
+      return
+
+    for concept in await self.kg_client.get_all_concepts():
+      name = concept["name"]
+      if not name:
+        continue
+      for alias in (name, *(concept["aliases"] or [])):
+        self.concept_cache.setdefault(_concept_cache_key(alias), name)
 
   def _determine_source_type(self, metadata: Dict[str, Any]) -> SourceType:
     """Determine source type from metadata."""
-    url = metadata.get("url", "").lower()
-    title = metadata.get("title", "").lower()
+    url = metadata.get("url") or ""
+    title = metadata.get("title") or ""
 
-    if "arxiv" in url or "research" in title:
+    if _ARXIV_URL_PATTERN.search(url) or _RESEARCH_TITLE_PATTERN.search(title):
       return SourceType.RESEARCH_PAPER
-    if "youtube" in url:
+    if _VIDEO_URL_PATTERN.search(url):
       return SourceType.VIDEO
     if url:
       return SourceType.WEBSITE
@@ -413,37 +704,41 @@ class KnowledgeGraphIntegrator:
 
   def _convert_concept_type(self, type_str: str) -> ConceptType:
     """Convert string type to ConceptType enum."""
-    type_mapping = {
-      "Person": ConceptType.PERSON,
-      "Organization": ConceptType.ORGANIZATION,
-      "Topic": ConceptType.TOPIC,
-      "Technology": ConceptType.TECHNOLOGY,
-      "Location": ConceptType.LOCATION,
-      "Event": ConceptType.EVENT,
-    }
-    return type_mapping.get(type_str, ConceptType.TOPIC)
+    return _CONCEPT_TYPE_MAP.get(type_str, ConceptType.TOPIC)
 
   def _find_relevant_concepts(
     self,
     claim_text: str,
-    concept_mapping: Dict[str, str],
+    lowered_concepts: List[Tuple[str, str]],
+    automaton: Optional[ahocorasick.Automaton] = None,
   ) -> List[str]:
-    """Find concepts mentioned in claim text."""
-    relevant_concepts = []
+    """Find concepts mentioned in claim text.
+
+    Args:
+      claim_text: Text of the claim to scan
+      lowered_concepts: (lowercased name, canonical name) pairs
+      automaton: Optional automaton built from the same pairs
+    """
     claim_lower = claim_text.lower()
 
-    for original_name, canonical_name in concept_mapping.items():
-      if original_name.lower() in claim_lower:
+    if automaton is not None:
+      # Single pass over the claim, reporting every (overlapping) concept match
+      matches = (
+        canonical_name
+        for _, canonical_names in automaton.iter(claim_lower)
+        for canonical_name in canonical_names
+      )
+      return list(dict.fromkeys(matches))
+
+    relevant_concepts = []
+
+    for name_lower, canonical_name in lowered_concepts:
+      if name_lower in claim_lower:
         if canonical_name not in relevant_concepts:
           relevant_concepts.append(canonical_name)
 
     return relevant_concepts
 
-  async def close(self):
-    """Close knowledge graph connection."""
-    if self.kg_client:
-      await self.kg_client.close()
-
 
 async def create_knowledge_integrator(
   config: Configuration,
@@ -452,9 +747,10 @@ async def create_knowledge_integrator(
   if not config.neo4j_config or not config.neo4j_config.enabled:
     return None
 
-  from open_deep_research.knowledge_graph import create_knowledge_graph_client
+  from open_deep_research.knowledge_graph import get_knowledge_graph_client
 
-  kg_client = await create_knowledge_graph_client(config.neo4j_config)
+  # The client is shared across turns, so the integrator must not close it
+  kg_client = await get_knowledge_graph_client(config.neo4j_config)
   if not kg_client:
     return None
 
@@ -1,17 +1,28 @@
 """Neo4j knowledge graph utilities for storing research results using Sources, Claims, and Concepts model."""
 
+import asyncio
+import contextlib
 import logging
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
-from neo4j import Driver, GraphDatabase
+from neo4j import READ_ACCESS, AsyncDriver, AsyncGraphDatabase, AsyncTransaction
 from open_deep_research.configuration import Neo4jConfig
-from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rows sent in a single UNWIND statement
+BULK_BATCH_SIZE = 1000
+
+# (uri, database) pairs whose indexes were already created by this process
+_indexed_databases: set[tuple[str, str]] = set()
+
 
 class SourceType(Enum):
   """Types of sources for information."""
@@ -35,7 +46,44 @@ class ConceptType(Enum):
   EVENT = "Event"
 
 
-class Source(BaseModel):
+# Labels cannot be parameterized, so build one fixed query per label up front
+_SOURCE_MERGE_QUERIES = MappingProxyType(
+  {
+    source_type: f"""
+    UNWIND $rows AS row
+    MERGE (s:Source:{source_type.value} {{id: row.id}})
+    SET s += row
+    """
+    for source_type in SourceType
+  },
+)
+
+_CONCEPT_MERGE_QUERIES = MappingProxyType(
+  {
+    concept_type: f"""
+    UNWIND $rows AS row
+    MERGE (con:Concept:{concept_type.value} {{name: row.name}})
+    SET con += row
+    """
+    for concept_type in ConceptType
+  },
+)
+
+# Valid claim-to-claim relationship types, each with its fixed query
+_CLAIM_RELATIONSHIP_QUERIES = MappingProxyType(
+  {
+    relationship_type: f"""
+    MATCH (c1:Claim {{id: $claim1_id}})
+    MATCH (c2:Claim {{id: $claim2_id}})
+    MERGE (c1)-[:{relationship_type}]->(c2)
+    """
+    for relationship_type in ("SUPPORTS", "CONTRADICTS")
+  },
+)
+
+
+@dataclass(slots=True, kw_only=True)
+class Source:
   """Represents a source of information in the knowledge graph."""
 
   id: str
@@ -45,9 +93,18 @@ class Source(BaseModel):
   publication_date: Optional[datetime] = None
   source_type: SourceType = SourceType.WEBSITE
   metadata: Optional[Dict[str, Any]] = None
+  # ISO form of publication_date, serialized once for every write
+  publication_date_iso: Optional[str] = field(init=False, repr=False)
+
+  def __post_init__(self) -> None:
+    """Serialize publication_date for writes."""
+    self.publication_date_iso = (
+      self.publication_date.isoformat() if self.publication_date else None
+    )
 
 
-class Claim(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Claim:
   """Represents an individual, verifiable statement extracted from a source."""
 
   id: str
@@ -56,19 +113,27 @@ class Claim(BaseModel):
   confidence_score: float = 0.8  # Agent's confidence in extraction
   timestamp: datetime
   source_id: str
+  # ISO form of timestamp, serialized once for every write
+  timestamp_iso: str = field(init=False, repr=False)
 
+  def __post_init__(self) -> None:
+    """Serialize timestamp for writes."""
+    self.timestamp_iso = self.timestamp.isoformat()
 
-class Concept(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class Concept:
   """Represents a normalized entity or abstract topic."""
 
   id: str
   name: str  # Canonical name
   concept_type: ConceptType
-  aliases: List[str] = []  # Alternative names
+  aliases: List[str] = field(default_factory=list)  # Alternative names
   description: Optional[str] = None
 
 
-class AgentRun(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentRun:
   """Represents a research session/run by the agent."""
 
   id: str
@@ -77,6 +142,12 @@ class AgentRun(BaseModel):
   agent_version: str = "open_deep_research_v1"
   status: str = "completed"
   metadata: Optional[Dict[str, Any]] = None
+  # ISO form of timestamp, serialized once for every write
+  timestamp_iso: str = field(init=False, repr=False)
+
+  def __post_init__(self) -> None:
+    """Serialize timestamp for writes."""
+    self.timestamp_iso = self.timestamp.isoformat()
 
 
 class Neo4jKnowledgeGraph:
@@ -85,36 +156,47 @@ class Neo4jKnowledgeGraph:
   def __init__(self, config: Neo4jConfig):
     """Initialize Neo4j connection."""
     self.config = config
-    self.driver: Optional[Driver] = None
+    self.driver: Optional[AsyncDriver] = None
 
   async def connect(self) -> bool:
     """Connect to Neo4j database."""
     try:
-      self.driver = GraphDatabase.driver(
+      # One pooled driver serves every session opened by this client
+      self.driver = AsyncGraphDatabase.driver(
         self.config.uri,
         auth=(self.config.username, self.config.password),
+        max_connection_pool_size=self.config.max_connection_pool_size,
+        connection_acquisition_timeout=self.config.connection_acquisition_timeout,
+        max_connection_lifetime=self.config.max_connection_lifetime,
       )
       # Test the connection
-      with self.driver.session(database=self.config.database) as session:
-        session.run("RETURN 1")
+      await self.driver.verify_connectivity()
       logger.info("Successfully connected to Neo4j database")
       return True
     except Exception as e:
-      logger.error(f"Failed to connect to Neo4j: {e}")
+      logger.error("Failed to connect to Neo4j: %s", e)
       return False
 
   async def close(self):
     """Close Neo4j connection."""
     if self.driver:
-      self.driver.close()
+      await self.driver.close()
       logger.info("Neo4j connection closed")
 
   async def create_indexes(self):
-    """Create necessary indexes for performance."""
+    """Create necessary indexes for performance.
+
+    Index creation is idempotent, so once every index has been created it is
+    skipped for that database for the rest of the process.
+    """
     if not self.driver:
       return
 
-    with self.driver.session(database=self.config.database) as session:
+    database_key = (self.config.uri, self.config.database)
+    if database_key in _indexed_databases:
+      return
+
+    async with self.driver.session(database=self.config.database) as session:
       # Create indexes for the Sources, Claims, and Concepts schema
       queries = [
         # Source indexes
@@ -124,6 +206,8 @@ class Neo4jKnowledgeGraph:
         "CREATE INDEX claim_id_index IF NOT EXISTS FOR (c:Claim) ON (c.id)",
         "CREATE INDEX claim_source_id_index IF NOT EXISTS FOR (c:Claim) ON (c.source_id)",
         "CREATE INDEX claim_timestamp_index IF NOT EXISTS FOR (c:Claim) ON (c.timestamp)",
+        # Composite index backing ORDER BY confidence_score, timestamp in find_related_claims
+        "CREATE INDEX claim_score_timestamp_index IF NOT EXISTS FOR (c:Claim) ON (c.confidence_score, c.timestamp)",
         # Concept indexes
         "CREATE INDEX concept_id_index IF NOT EXISTS FOR (con:Concept) ON (con.id)",
         "CREATE INDEX concept_name_index IF NOT EXISTS FOR (con:Concept) ON (con.name)",
@@ -133,11 +217,18 @@ class Neo4jKnowledgeGraph:
         "CREATE INDEX agent_run_timestamp_index IF NOT EXISTS FOR (ar:AgentRun) ON (ar.timestamp)",
       ]
 
+      failed = False
       for query in queries:
         try:
-          session.run(query)
+          # Consume so a failure surfaces here rather than going unnoticed
+          await (await session.run(query)).consume()
         except Exception as e:
-          logger.warning(f"Index creation warning: {e}")
+          logger.warning("Index creation warning: %s", e)
+          failed = True
+
+    # A failure may be transient, so leave the database to be retried next time
+    if not failed:
+      _indexed_databases.add(database_key)
 
   async def store_agent_run(self, agent_run: AgentRun) -> bool:
     """Store an agent run node."""
@@ -146,7 +237,7 @@ class Neo4jKnowledgeGraph:
       return False
 
     try:
-      with self.driver.session(database=self.config.database) as session:
+      async with self.driver.session(database=self.config.database) as session:
         query = """
                 MERGE (ar:AgentRun {id: $id})
                 SET ar.initial_query = $initial_query,
@@ -154,69 +245,32 @@ class Neo4jKnowledgeGraph:
                     ar.agent_version = $agent_version,
                     ar.status = $status,
                     ar.metadata = $metadata
-                RETURN ar
                 """
 
-        result = session.run(
+        result = await session.run(
           query,
           {
             "id": agent_run.id,
             "initial_query": agent_run.initial_query,
-            "timestamp": agent_run.timestamp.isoformat(),
+            "timestamp": agent_run.timestamp_iso,
             "agent_version": agent_run.agent_version,
             "status": agent_run.status,
             "metadata": agent_run.metadata or {},
           },
         )
+        await result.consume()
 
-        logger.info(f"Stored agent run: {agent_run.id}")
+        logger.info("Stored agent run: %s", agent_run.id)
         return True
 
     except Exception as e:
-      logger.error(f"Failed to store agent run: {e}")
+      logger.error("Failed to store agent run: %s", e)
       return False
 
   async def store_source(self, source: Source) -> bool:
     """Store a source node with appropriate label."""
-    if not self.driver:
-      logger.error("No Neo4j connection available")
-      return False
-
-    try:
-      with self.driver.session(database=self.config.database) as session:
-        # Use dynamic label based on source type
-        query = f"""
-                MERGE (s:Source:{source.source_type.value} {{id: $id}})
-                SET s.url = $url,
-                    s.title = $title,
-                    s.author = $author,
-                    s.publication_date = $publication_date,
-                    s.source_type = $source_type,
-                    s.metadata = $metadata
-                RETURN s
-                """
-
-        result = session.run(
-          query,
-          {
-            "id": source.id,
-            "url": source.url,
-            "title": source.title,
-            "author": source.author,
-            "publication_date": source.publication_date.isoformat()
-            if source.publication_date
-            else None,
-            "source_type": source.source_type.value,
-            "metadata": source.metadata or {},
-          },
-        )
-
-        logger.info(f"Stored source: {source.id} ({source.source_type.value})")
-        return True
-
-    except Exception as e:
-      logger.error(f"Failed to store source: {e}")
-      return False
+    # Share the bulk query text so each label has a single cached plan
+    return await self.store_sources_bulk([source])
 
   async def store_claim(self, claim: Claim, agent_run_id: str) -> bool:
     """Store a claim node and link it to source and agent run."""
@@ -225,7 +279,7 @@ class Neo4jKnowledgeGraph:
       return False
 
     try:
-      with self.driver.session(database=self.config.database) as session:
+      async with self.driver.session(database=self.config.database) as session:
         query = """
                 MERGE (c:Claim {id: $id})
                 SET c.text = $text,
@@ -239,64 +293,287 @@ class Neo4jKnowledgeGraph:
                 WITH c
                 MATCH (ar:AgentRun {id: $agent_run_id})
                 MERGE (ar)-[:GENERATED]->(c)
-                RETURN c
                 """
 
-        result = session.run(
+        result = await session.run(
           query,
           {
             "id": claim.id,
             "text": claim.text,
             "quote": claim.quote,
             "confidence_score": claim.confidence_score,
-            "timestamp": claim.timestamp.isoformat(),
+            "timestamp": claim.timestamp_iso,
             "source_id": claim.source_id,
             "agent_run_id": agent_run_id,
           },
         )
+        await result.consume()
 
-        logger.info(f"Stored claim: {claim.id}")
+        logger.info("Stored claim: %s", claim.id)
         return True
 
     except Exception as e:
-      logger.error(f"Failed to store claim: {e}")
+      logger.error("Failed to store claim: %s", e)
       return False
 
   async def store_concept(self, concept: Concept) -> bool:
     """Store a concept node with appropriate label."""
+    # Share the bulk query text so each label has a single cached plan
+    return await self.store_concepts_bulk([concept])
+
+  @asynccontextmanager
+  async def transaction(self) -> AsyncIterator[AsyncTransaction]:
+    """Open an explicit write transaction that commits once on exit.
+
+    Bulk store methods given this transaction write through it, so a group of
+    writes shares a single commit. Raising inside the block rolls it back.
+    """
+    if not self.driver:
+      msg = "No Neo4j connection available"
+      raise RuntimeError(msg)
+
+    async with (
+      self.driver.session(database=self.config.database) as session,
+      await session.begin_transaction() as tx,
+    ):
+      yield tx
+
+  async def _execute_write(
+    self,
+    work: Callable[[AsyncTransaction], Awaitable[None]],
+    tx: Optional[AsyncTransaction],
+  ) -> None:
+    """Run write work in the given transaction, or in its own managed one."""
+    if tx is not None:
+      await work(tx)
+      return
+
+    async with self.driver.session(database=self.config.database) as session:
+      await session.execute_write(work)
+
+  async def store_sources_bulk(
+    self,
+    sources: List[Source],
+    tx: Optional[AsyncTransaction] = None,
+  ) -> bool:
+    """Store many source nodes in one transaction using UNWIND."""
     if not self.driver:
       logger.error("No Neo4j connection available")
       return False
 
+    if not sources:
+      return True
+
+    # Group rows by source type since labels cannot be parameterized
+    rows_by_type: Dict[SourceType, List[Dict[str, Any]]] = {}
+    for source in sources:
+      rows_by_type.setdefault(source.source_type, []).append(
+        {
+          "id": source.id,
+          "url": source.url,
+          "title": source.title,
+          "author": source.author,
+          "publication_date": source.publication_date_iso,
+          "source_type": source.source_type.value,
+          "metadata": source.metadata or {},
+        },
+      )
+
+    async def _write(tx: AsyncTransaction) -> None:
+      for source_type, rows in rows_by_type.items():
+        query = _SOURCE_MERGE_QUERIES[source_type]
+        for batch in _batched(rows):
+          await (await tx.run(query, {"rows": batch})).consume()
+
     try:
-      with self.driver.session(database=self.config.database) as session:
-        # Use dynamic label based on concept type
-        query = f"""
-                MERGE (con:Concept:{concept.concept_type.value} {{name: $name}})
-                SET con.id = $id,
-                    con.aliases = $aliases,
-                    con.description = $description,
-                    con.concept_type = $concept_type
-                RETURN con
-                """
+      await self._execute_write(_write, tx)
+    except Exception as e:
+      logger.error("Failed to store sources: %s", e)
+      return False
+    else:
+      logger.info("Stored %s sources", len(sources))
+      return True
 
-        result = session.run(
-          query,
-          {
-            "id": concept.id,
-            "name": concept.name,
-            "aliases": concept.aliases,
-            "description": concept.description,
-            "concept_type": concept.concept_type.value,
-          },
-        )
+  async def store_concepts_bulk(
+    self,
+    concepts: List[Concept],
+    tx: Optional[AsyncTransaction] = None,
+  ) -> bool:
+    """Store many concept nodes in one transaction using UNWIND."""
+    if not self.driver:
+      logger.error("No Neo4j connection available")
+      return False
 
-        logger.info(f"Stored concept: {concept.name} ({concept.concept_type.value})")
-        return True
+    if not concepts:
+      return True
+
+    # Group rows by concept type since labels cannot be parameterized
+    rows_by_type: Dict[ConceptType, List[Dict[str, Any]]] = {}
+    for concept in concepts:
+      rows_by_type.setdefault(concept.concept_type, []).append(
+        {
+          "id": concept.id,
+          "name": concept.name,
+          "aliases": concept.aliases,
+          "description": concept.description,
+          "concept_type": concept.concept_type.value,
+        },
+      )
+
+    async def _write(tx: AsyncTransaction) -> None:
+      for concept_type, rows in rows_by_type.items():
+        query = _CONCEPT_MERGE_QUERIES[concept_type]
+        for batch in _batched(rows):
+          await (await tx.run(query, {"rows": batch})).consume()
+
+    try:
+      await self._execute_write(_write, tx)
+    except Exception as e:
+      logger.error("Failed to store concepts: %s", e)
+      return False
+    else:
+      logger.info("Stored %s concepts", len(concepts))
+      return True
+
+  async def store_claims_bulk(
+    self,
+    claims: List[Claim],
+    agent_run_id: str,
+    tx: Optional[AsyncTransaction] = None,
+  ) -> bool:
+    """Store many claim nodes in one transaction and link them to sources and agent run."""
+    if not self.driver:
+      logger.error("No Neo4j connection available")
+      return False
+
+    if not claims:
+      return True
+
+    rows = [
+      {
+        "id": claim.id,
+        "text": claim.text,
+        "quote": claim.quote,
+        "confidence_score": claim.confidence_score,
+        "timestamp": claim.timestamp_iso,
+        "source_id": claim.source_id,
+      }
+      for claim in claims
+    ]
+
+    query = """
+            UNWIND $rows AS row
+            MERGE (c:Claim {id: row.id})
+            SET c += row
+            WITH c, row
+            MATCH (s:Source {id: row.source_id})
+            MERGE (c)-[:EXTRACTED_FROM]->(s)
+            WITH c
+            MATCH (ar:AgentRun {id: $agent_run_id})
+            MERGE (ar)-[:GENERATED]->(c)
+            """
+
+    async def _write(tx: AsyncTransaction) -> None:
+      for batch in _batched(rows):
+        result = await tx.run(query, {"rows": batch, "agent_run_id": agent_run_id})
+        await result.consume()
+
+    try:
+      await self._execute_write(_write, tx)
+    except Exception as e:
+      logger.error("Failed to store claims: %s", e)
+      return False
+    else:
+      logger.info("Stored %s claims", len(claims))
+      return True
+
+  async def link_claims_to_concepts_bulk(
+    self,
+    mentions: Dict[str, List[str]],
+    tx: Optional[AsyncTransaction] = None,
+  ) -> bool:
+    """Create MENTIONS relationships for many claims in one transaction.
+
+    Args:
+        mentions: Mapping of claim id to the concept names it mentions
+        tx: Open transaction to write through instead of a new one
+    """
+    if not self.driver:
+      logger.error("No Neo4j connection available")
+      return False
+
+    if not mentions:
+      return True
+
+    rows = [
+      {"claim_id": claim_id, "concept_names": concept_names}
+      for claim_id, concept_names in mentions.items()
+    ]
+
+    query = """
+            UNWIND $rows AS row
+            MATCH (c:Claim {id: row.claim_id})
+            UNWIND row.concept_names AS concept_name
+            MATCH (con:Concept {name: concept_name})
+            MERGE (c)-[:MENTIONS]->(con)
+            """
+
+    async def _write(tx: AsyncTransaction) -> None:
+      for batch in _batched(rows):
+        await (await tx.run(query, {"rows": batch})).consume()
+
+    try:
+      await self._execute_write(_write, tx)
+    except Exception as e:
+      logger.error("Failed to link claims to concepts: %s", e)
+      return False
+    else:
+      logger.info("Created MENTIONS relationships for %s claims", len(mentions))
+      return True
+
+  async def store_research_result(
+    self,
+    agent_run_id: str,
+    sources: List[Source],
+    concepts: List[Concept],
+    claims: List[Claim],
+    mentions: Dict[str, List[str]],
+  ) -> bool:
+    """Store sources, concepts, claims and their links under a single commit.
+
+    Nothing is written if any part fails.
 
+    Args:
+        agent_run_id: Agent run that generated the claims
+        sources: Sources the claims were extracted from
+        concepts: New concepts to store
+        claims: Claims to store and link to their sources and the agent run
+        mentions: Mapping of claim id to the concept names it mentions
+    """
+    if not self.driver:
+      logger.error("No Neo4j connection available")
+      return False
+
+    async def _write(tx: AsyncTransaction) -> None:
+      stored = (
+        await self.store_sources_bulk(sources, tx)
+        and await self.store_concepts_bulk(concepts, tx)
+        and await self.store_claims_bulk(claims, agent_run_id, tx)
+        and await self.link_claims_to_concepts_bulk(mentions, tx)
+      )
+      if not stored:
+        # Raising inside the transaction rolls back the partial writes
+        msg = "Failed to write research result"
+        raise RuntimeError(msg)
+
+    try:
+      async with self.transaction() as tx:
+        await _write(tx)
     except Exception as e:
-      logger.error(f"Failed to store concept: {e}")
+      logger.error("Failed to store research result: %s", e)
       return False
+    else:
+      return True
 
   async def link_claim_to_concepts(
     self,
@@ -309,7 +586,7 @@ class Neo4jKnowledgeGraph:
       return False
 
     try:
-      with self.driver.session(database=self.config.database) as session:
+      async with self.driver.session(database=self.config.database) as session:
         query = """
                 MATCH (c:Claim {id: $claim_id})
                 UNWIND $concept_names as concept_name
@@ -318,18 +595,18 @@ class Neo4jKnowledgeGraph:
                 RETURN COUNT(*) as relationships_created
                 """
 
-        result = session.run(
+        result = await session.run(
           query,
           {"claim_id": claim_id, "concept_names": concept_names},
         )
 
-        record = result.single()
+        record = await result.single()
         count = record["relationships_created"] if record else 0
-        logger.info(f"Created {count} MENTIONS relationships for claim {claim_id}")
+        logger.info("Created %s MENTIONS relationships for claim %s", count, claim_id)
         return True
 
     except Exception as e:
-      logger.error(f"Failed to link claim to concepts: {e}")
+      logger.error("Failed to link claim to concepts: %s", e)
       return False
 
   async def link_claims(
@@ -343,42 +620,75 @@ class Neo4jKnowledgeGraph:
       logger.error("No Neo4j connection available")
       return False
 
-    if relationship_type not in ["SUPPORTS", "CONTRADICTS"]:
-      logger.error(f"Invalid relationship type: {relationship_type}")
+    query = _CLAIM_RELATIONSHIP_QUERIES.get(relationship_type)
+    if query is None:
+      logger.error("Invalid relationship type: %s", relationship_type)
       return False
 
     try:
-      with self.driver.session(database=self.config.database) as session:
-        query = f"""
-                MATCH (c1:Claim {{id: $claim1_id}})
-                MATCH (c2:Claim {{id: $claim2_id}})
-                MERGE (c1)-[:{relationship_type}]->(c2)
-                RETURN c1, c2
-                """
-
-        result = session.run(query, {"claim1_id": claim1_id, "claim2_id": claim2_id})
+      async with self.driver.session(database=self.config.database) as session:
+        result = await session.run(
+          query,
+          {"claim1_id": claim1_id, "claim2_id": claim2_id},
+        )
+        await result.consume()
 
         logger.info(
-          f"Created {relationship_type} relationship between {claim1_id} and {claim2_id}",
+          "Created %s relationship between %s and %s",
+          relationship_type,
+          claim1_id,
+          claim2_id,
         )
         return True
 
     except Exception as e:
-      logger.error(f"Failed to link claims: {e}")
+      logger.error("Failed to link claims: %s", e)
       return False
 
+  async def get_all_concepts(self) -> List[Dict[str, Any]]:
+    """Get the name and aliases of every stored concept."""
+    if not self.driver:
+      logger.error("No Neo4j connection available")
+      return []
+
+    try:
+      async with self.driver.session(
+        database=self.config.database,
+        default_access_mode=READ_ACCESS,
+      ) as session:
+        query = """
+                MATCH (con:Concept)
+                RETURN con.name as name, con.aliases as aliases
+                """
+
+        concepts = await (await session.run(query)).data()
+
+        logger.info("Loaded %s existing concepts", len(concepts))
+        return concepts
+
+    except Exception as e:
+      logger.error("Failed to load concepts: %s", e)
+      return []
+
   async def find_related_claims(
     self,
     concept_names: List[str],
     limit: int = 10,
-  ) -> List[Dict[str, Any]]:
-    """Find claims that mention any of the given concepts."""
+  ) -> AsyncIterator[Dict[str, Any]]:
+    """Find claims that mention any of the given concepts.
+
+    Claims are yielded as the driver fetches them rather than collected into a
+    list, so callers iterate with ``async for``.
+    """
     if not self.driver:
       logger.error("No Neo4j connection available")
-      return []
+      return
 
     try:
-      with self.driver.session(database=self.config.database) as session:
+      async with self.driver.session(
+        database=self.config.database,
+        default_access_mode=READ_ACCESS,
+      ) as session:
         query = """
                 MATCH (c:Claim)-[:MENTIONS]->(con:Concept)
                 WHERE con.name IN $concept_names
@@ -392,27 +702,20 @@ class Neo4jKnowledgeGraph:
                 LIMIT $limit
                 """
 
-        result = session.run(query, {"concept_names": concept_names, "limit": limit})
+        result = await session.run(
+          query,
+          {"concept_names": concept_names, "limit": limit},
+        )
 
-        claims = [
-          {
-            "claim_id": record["claim_id"],
-            "claim_text": record["claim_text"],
-            "confidence_score": record["confidence_score"],
-            "timestamp": record["timestamp"],
-            "source_title": record["source_title"],
-            "source_url": record["source_url"],
-            "mentioned_concepts": record["mentioned_concepts"],
-          }
-          for record in result
-        ]
+        found = 0
+        async for record in result:
+          found += 1
+          yield record.data()
 
-        logger.info(f"Found {len(claims)} related claims for concepts: {concept_names}")
-        return claims
+        logger.info("Found %s related claims for concepts: %s", found, concept_names)
 
     except Exception as e:
-      logger.error(f"Failed to find related claims: {e}")
-      return []
+      logger.error("Failed to find related claims: %s", e)
 
   async def get_agent_run_summary(self, agent_run_id: str) -> Optional[Dict[str, Any]]:
     """Get summary of an agent run with all generated claims."""
@@ -421,26 +724,39 @@ class Neo4jKnowledgeGraph:
       return None
 
     try:
-      with self.driver.session(database=self.config.database) as session:
+      async with self.driver.session(
+        database=self.config.database,
+        default_access_mode=READ_ACCESS,
+      ) as session:
         query = """
                 MATCH (ar:AgentRun {id: $agent_run_id})
+                CALL {
+                  WITH ar
+                  OPTIONAL MATCH (ar)-[:GENERATED]->(:Claim)-[:MENTIONS]->(con:Concept)
+                  RETURN COUNT(DISTINCT con) as total_concepts
+                }
                 OPTIONAL MATCH (ar)-[:GENERATED]->(c:Claim)-[:EXTRACTED_FROM]->(s:Source)
-                OPTIONAL MATCH (c)-[:MENTIONS]->(con:Concept)
+                // Aggregate concepts per claim so rows stay O(claims)
+                CALL {
+                  WITH c
+                  OPTIONAL MATCH (c)-[:MENTIONS]->(con:Concept)
+                  RETURN COLLECT(DISTINCT con.name) as concepts
+                }
                 RETURN ar,
+                      total_concepts,
                       COUNT(DISTINCT c) as total_claims,
                       COUNT(DISTINCT s) as total_sources,
-                      COUNT(DISTINCT con) as total_concepts,
-                      COLLECT(DISTINCT {
+                      COLLECT(CASE WHEN c IS NOT NULL THEN {
                           claim_id: c.id,
                           claim_text: c.text,
                           confidence_score: c.confidence_score,
                           source_title: s.title,
-                          concepts: COLLECT(DISTINCT con.name)
-                      }) as claims_details
+                          concepts: concepts
+                      } END) as claims_details
                 """
 
-        result = session.run(query, {"agent_run_id": agent_run_id})
-        record = result.single()
+        result = await session.run(query, {"agent_run_id": agent_run_id})
+        record = await result.single()
 
         if record:
           agent_run = record["ar"]
@@ -457,16 +773,70 @@ class Neo4jKnowledgeGraph:
               "total_sources": record["total_sources"],
               "total_concepts": record["total_concepts"],
             },
-            "claims": [c for c in record["claims_details"] if c["claim_id"]],
+            "claims": record["claims_details"],
           }
 
         return None
 
     except Exception as e:
-      logger.error(f"Failed to get agent run summary: {e}")
+      logger.error("Failed to get agent run summary: %s", e)
       return None
 
 
+# Connected clients by (uri, database, username) with the loop they were opened
+# on, shared across supervisor turns so each driver's pool is reused
+_shared_clients: Dict[
+  Tuple[str, str, str],
+  Tuple[Neo4jKnowledgeGraph, asyncio.AbstractEventLoop],
+] = {}
+
+
+async def get_knowledge_graph_client(
+  config: Neo4jConfig,
+) -> Optional[Neo4jKnowledgeGraph]:
+  """Return the process-wide client for a database, connecting on first use.
+
+  The client stays open across calls; close_knowledge_graph_clients() closes
+  every shared client, e.g. on application shutdown.
+  """
+  if not config.enabled:
+    logger.info("Neo4j knowledge graph storage is disabled")
+    return None
+
+  key = (config.uri, config.database, config.username)
+  loop = asyncio.get_running_loop()
+  cached = _shared_clients.get(key)
+  if cached is not None:
+    client, client_loop = cached
+    # Connections are bound to the loop they were opened on
+    if client_loop is loop:
+      return client
+    del _shared_clients[key]
+    # Its connections may belong to a loop that has already closed
+    with contextlib.suppress(Exception):
+      await client.close()
+
+  client = await create_knowledge_graph_client(config)
+  if client is None:
+    return None
+
+  # Another caller may have connected while this one was connecting
+  cached = _shared_clients.get(key)
+  if cached is not None and cached[1] is loop:
+    await client.close()
+    return cached[0]
+
+  _shared_clients[key] = (client, loop)
+  return client
+
+
+async def close_knowledge_graph_clients() -> None:
+  """Close every shared knowledge graph client, e.g. on application shutdown."""
+  clients = [client for client, _ in _shared_clients.values()]
+  _shared_clients.clear()
+  await asyncio.gather(*(client.close() for client in clients))
+
+
 async def create_knowledge_graph_client(
   config: Neo4jConfig,
 ) -> Optional[Neo4jKnowledgeGraph]:
@@ -482,6 +852,11 @@ async def create_knowledge_graph_client(
   return None
 
 
+def _batched(rows: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+  """Split rows into UNWIND-sized batches."""
+  return [rows[i : i + BULK_BATCH_SIZE] for i in range(0, len(rows), BULK_BATCH_SIZE)]
+
+
 def generate_id() -> str:
   """Generate a unique ID for nodes."""
   return str(uuid.uuid4())
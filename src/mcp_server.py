@@ -2,10 +2,16 @@
 
 import logging
 import os
+import queue
 import ssl
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from logging.handlers import QueueHandler, QueueListener
 
-import aiohttp
+import httpx
+import orjson
 from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi_mcp import FastApiMCP
 
 # Set up logging
@@ -15,8 +21,80 @@ logger = logging.getLogger(__name__)
 # Financial Modeling Prep API Key from environment
 FMP_API_KEY = os.getenv("FMP_API_KEY")
 
+# Verifying TLS context, built once so the CA bundle loads once
+SSL_CONTEXT = ssl.create_default_context()
+
+# Company profile layout, filled from the FMP profile fields
+PROFILE_TEMPLATE = """Company Profile for {query_symbol}:
+Company Name: {companyName}
+Symbol: {symbol}
+Price: ${price}
+Beta: {beta}
+Market Cap: {mkt_cap}
+Last Dividend: ${lastDiv}
+Range: ${range}
+Changes: {changes}%
+Industry: {industry}
+Sector: {sector}
+Country: {country}
+CEO: {ceo}
+Website: {website}
+Description: {description}...
+Exchange: {exchangeShortName}
+Full-time Employees: {fullTimeEmployees}"""
+
+
+class _ProfileFields(dict):
+  """Profile fields that render missing keys as N/A."""
+
+  def __missing__(self, key: str) -> str:
+    return "N/A"
+
+
+@contextmanager
+def _queued_logging() -> Iterator[None]:
+  """Route root log records through a background thread while serving.
+
+  Writing records then never blocks the event loop. The root handlers are
+  restored, and the listener thread stopped, on exit.
+  """
+  root = logging.getLogger()
+  handlers = root.handlers[:]
+  log_queue: queue.SimpleQueue = queue.SimpleQueue()
+  listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+  root.handlers = [QueueHandler(log_queue)]
+  listener.start()
+  try:
+    yield
+  finally:
+    root.handlers = handlers
+    listener.stop()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+  """Run the log listener and one pooled HTTP/2 client for the server's lifetime.
+
+  The client is kept on app.state for upstream API calls.
+  """
+  with _queued_logging():
+    async with httpx.AsyncClient(
+      http2=True,
+      verify=SSL_CONTEXT,
+      limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    ) as client:
+      app.state.http_client = client
+      yield
+    app.state.http_client = None
+
+
 # Initialize FastAPI app
-app = FastAPI(title="Financial MCP Server", version="1.0.0")
+app = FastAPI(
+  title="Financial MCP Server",
+  version="1.0.0",
+  lifespan=lifespan,
+  default_response_class=ORJSONResponse,
+)
 
 # Create router for financial tools
 financial_router = APIRouter(prefix="/financial", tags=["financial"])
@@ -33,7 +111,7 @@ async def get_company_profile(symbol: str) -> str:
   Args:
       symbol: Stock symbol (e.g., AAPL, GOOGL, MSFT)
   """
-  logger.info(f"🔧 MCP TOOL CALLED: get_company_profile for symbol: {symbol}")
+  logger.info("🔧 MCP TOOL CALLED: get_company_profile for symbol: %s", symbol)
 
   if not FMP_API_KEY:
     logger.error("FMP_API_KEY not configured")
@@ -42,55 +120,37 @@ async def get_company_profile(symbol: str) -> str:
   url = f"https://financialmodelingprep.com/api/v3/profile/{symbol}"
   params = {"apikey": FMP_API_KEY}
 
-  # Create SSL context that doesn't verify certificates
-  ssl_context = ssl.create_default_context()
-  ssl_context.check_hostname = False
-  ssl_context.verify_mode = ssl.CERT_NONE
-
-  # Create connector with SSL context
-  connector = aiohttp.TCPConnector(ssl=ssl_context)
-
-  async with aiohttp.ClientSession(connector=connector) as session:
-    try:
-      async with session.get(url, params=params) as response:
-        if response.status != 200:
-          return f"Error: HTTP {response.status}"
-
-        data = await response.json()
-
-        if not data:
-          return f"No company profile found for {symbol}"
-
-        if isinstance(data, list) and len(data) > 0:
-          company = data[0]
-        elif isinstance(data, dict):
-          company = data
-        else:
-          return f"Invalid data format received for {symbol}"
-
-        mkt_cap = company.get("mktCap")
-        mkt_cap_str = f"${mkt_cap:,}" if mkt_cap else "N/A"
-
-        return f"""Company Profile for {symbol}:
-Company Name: {company.get("companyName", "N/A")}
-Symbol: {company.get("symbol", "N/A")}
-Price: ${company.get("price", "N/A")}
-Beta: {company.get("beta", "N/A")}
-Market Cap: {mkt_cap_str}
-Last Dividend: ${company.get("lastDiv", "N/A")}
-Range: ${company.get("range", "N/A")}
-Changes: {company.get("changes", "N/A")}%
-Industry: {company.get("industry", "N/A")}
-Sector: {company.get("sector", "N/A")}
-Country: {company.get("country", "N/A")}
-CEO: {company.get("ceo", "N/A")}
-Website: {company.get("website", "N/A")}
-Description: {company.get("description", "N/A")[:300]}...
-Exchange: {company.get("exchangeShortName", "N/A")}
-Full-time Employees: {company.get("fullTimeEmployees", "N/A")}"""
-
-    except Exception as e:
-      return f"Error fetching company profile: {e!s}"
+  http_client = getattr(app.state, "http_client", None)
+  if http_client is None:
+    return "Error: HTTP client not initialized"
+
+  try:
+    response = await http_client.get(url, params=params)
+    if response.status_code != 200:
+      return f"Error: HTTP {response.status_code}"
+
+    data = orjson.loads(response.content)
+
+    if not data:
+      return f"No company profile found for {symbol}"
+
+    if isinstance(data, list) and len(data) > 0:
+      company = data[0]
+    elif isinstance(data, dict):
+      company = data
+    else:
+      return f"Invalid data format received for {symbol}"
+
+    mkt_cap = company.get("mktCap")
+    fields = _ProfileFields(company)
+    fields["query_symbol"] = symbol
+    fields["mkt_cap"] = f"${mkt_cap:,}" if mkt_cap else "N/A"
+    fields["description"] = company.get("description", "N/A")[:300]
+
+    return PROFILE_TEMPLATE.format_map(fields)
+
+  except Exception as e:
+    return f"Error fetching company profile: {e!s}"
 
 
 # Include the router in the app
@@ -114,4 +174,16 @@ mcp.mount()
 if __name__ == "__main__":
   import uvicorn
 
-  uvicorn.run(app, host="127.0.0.1", port=8000)
+  # Multiple workers require passing the app as an import string
+  uvicorn.run(
+    "open_deep_research.mcp_server:app",
+    host="127.0.0.1",
+    port=8000,
+    # A single worker by default, since each one runs its own upstream client
+    # and adds to FMP rate-limit pressure; more are opt-in
+    workers=int(os.getenv("MCP_SERVER_WORKERS", "1")),
+    # "auto" picks uvloop and httptools when installed, and falls back to
+    # asyncio and h11 where they are not available, e.g. on Windows
+    loop="auto",
+    http="auto",
+  )
@@ -160,19 +160,26 @@ You have access to multiple research tools:
 
 **Financial Data Tools (when researching companies, stocks, or financial topics):**
 2. **get_company_profile**: Get comprehensive company information (CEO, market cap, industry, business description)
-3. **get_full_stock_quote**: Get detailed stock quotes with P/E ratio, volume, year high/low
-4. **get_short_stock_quote**: Get basic stock quotes for quick price checks (supports indices with ^ prefix)
-5. **get_eod_quotes**: Get historical end-of-day price data for stocks and indices
-6. **get_economic_events**: Get economic calendar events (CPI, GDP, Fed meetings)
-7. **get_treasury_rates**: Get US Treasury rates for various maturities
-8. **get_income_statement**: Get company revenue, profit, and operating income data
-9. **get_balance_sheet**: Get company assets, liabilities, and equity information
-10. **get_cash_flow**: Get operating, investing, and financing cash flows
-11. **get_key_metrics**: Get financial ratios (P/E, ROE, ROA, debt ratios)
-12. **get_stock_news**: Get recent news articles for specific stocks
+3. **get_company_profiles_batch**: Get company profiles for several symbols in one call - use instead of repeated get_company_profile calls
+4. **get_full_stock_quote**: Get detailed stock quotes with P/E ratio, volume, year high/low
+5. **get_short_stock_quote**: Get basic stock quotes for quick price checks (supports indices with ^ prefix)
+6. **get_stock_quotes_batch**: Get quotes for several stocks or indices in one call - use instead of repeated quote calls
+7. **get_eod_quotes**: Get historical end-of-day price data for stocks and indices
+8. **get_economic_events**: Get economic calendar events (CPI, GDP, Fed meetings)
+9. **get_treasury_rates**: Get US Treasury rates for various maturities
+10. **get_income_statement**: Get company revenue, profit, and operating income data
+11. **get_income_statement_batch**: Get income statements for several companies in one call - use when comparing companies
+12. **get_balance_sheet**: Get company assets, liabilities, and equity information
+13. **get_balance_sheet_batch**: Get balance sheets for several companies in one call - use when comparing companies
+14. **get_cash_flow**: Get operating, investing, and financing cash flows
+15. **get_cash_flow_batch**: Get cash flow statements for several companies in one call - use when comparing companies
+16. **get_financial_statements**: Get the income statement, balance sheet, and cash flow together in one call
+17. **get_key_metrics**: Get financial ratios (P/E, ROE, ROA, debt ratios)
+18. **get_key_metrics_batch**: Get key metrics for several companies in one call - use when comparing companies
+19. **get_stock_news**: Get recent news articles for specific stocks
 
 **Planning & Completion Tools:**
-13. **think_tool**: For reflection and strategic planning during research
+20. **think_tool**: For reflection and strategic planning during research
 {mcp_prompt}
 
 **CRITICAL: Use think_tool after each search or financial data query to reflect on results and plan next steps. Do not call think_tool with other tools in parallel.**
@@ -186,6 +193,7 @@ You have access to multiple research tools:
 - Use ^ prefix for major indices (^GSPC for S&P 500, ^VIX for volatility, etc.)
 - Financial tools provide exact numbers and official sources - much more reliable than web search for financial data
 - Combine multiple financial tools for comprehensive analysis
+- When comparing several companies, use the _batch tools to fetch every symbol in one call rather than one call per symbol
 
 **Example workflow for company research:**
 1. get_company_profile → get basic info and market cap
@@ -415,3 +423,32 @@ Remember, your goal is to create a summary that can be easily understood and uti
 
 Today's date is {date}.
 """
+
+
+knowledge_extraction_prompt = """You are a research analyst tasked with extracting key claims and concepts from research content.
+
+RESEARCH TOPIC: {research_topic}
+
+RESEARCH CONTENT:
+{research_content}
+
+Your task:
+1. Extract 3-7 key CLAIMS - factual statements that can be verified
+2. Extract 5-12 CONCEPTS - important entities, topics, or ideas mentioned
+3. Provide 2-4 high-level INSIGHTS or conclusions
+
+Guidelines for CLAIMS:
+- Must be specific and factual
+- Should be verifiable from the source material
+- Include direct quotes when possible
+- Avoid opinions or speculation
+- Focus on novel or important information
+
+Guidelines for CONCEPTS:
+- Include people, organizations, technologies, topics, locations, events
+- Use canonical names (e.g., "Artificial Intelligence" not "AI")
+- Provide clear, brief descriptions
+- List common aliases or synonyms
+- Rate importance based on relevance to research topic
+
+Be precise and focus on quality over quantity."""
@@ -1,15 +1,173 @@
 """Financial Modeling Prep API client."""
 
+import asyncio
+import functools
+import hashlib
 import logging
 import os
 import ssl
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-
-import aiohttp
+import tempfile
+import time
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
+
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Seconds a response stays cached, keyed by the first segment of its endpoint
+CACHE_TTLS = MappingProxyType(
+  {
+    "profile": 3600,
+    "quote": 15,
+    "historical-price-eod": 3600,
+    "historical-price-full": 3600,
+    "economic_calendar": 900,
+    "treasury-rates": 3600,
+    "income-statement": 86400,
+    "balance-sheet-statement": 86400,
+    "cash-flow-statement": 86400,
+    "key-metrics": 86400,
+    "ratios": 86400,
+    "analyst-estimates": 86400,
+    "news": 300,
+    "search-symbol": 86400,
+    "stock": 86400,
+  },
+)
+DEFAULT_CACHE_TTL = 60
+
+# Seconds a response stays cached on disk, only for slow-moving endpoints
+DISK_CACHE_TTLS = MappingProxyType(
+  {
+    # Profiles carry price and market cap, so they expire with the memory entry
+    "profile": CACHE_TTLS["profile"],
+    "search-symbol": 7 * 86400,
+    "stock": 7 * 86400,
+    "income-statement": 86400,
+    "balance-sheet-statement": 86400,
+    "cash-flow-statement": 86400,
+    "key-metrics": 86400,
+    "ratios": 86400,
+    "analyst-estimates": 86400,
+    "treasury-rates": 3600,
+  },
+)
+DEFAULT_DISK_CACHE_DIR = Path.home() / ".cache" / "open-deep-research" / "fmp"
+# Upper bound on cached responses, the oldest entry is evicted first
+CACHE_MAX_ENTRIES = 1024
+
+# Verifying TLS context shared by every client, so the CA bundle loads once
+_SSL_CONTEXT = ssl.create_default_context()
+
+CacheKey = Tuple[bool, str, Tuple[Tuple[str, Any], ...]]
+
+# Maximum requests in flight at once for multi-symbol fetches
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Longest date range the economic calendar endpoint accepts
+ECONOMIC_EVENTS_MAX_RANGE = timedelta(days=30)
+
+# Key line items returned by the statement tools unless other fields are asked for,
+# named as in the /stable statement payloads
+DEFAULT_INCOME_FIELDS = (
+  "date",
+  "period",
+  "revenue",
+  "grossProfit",
+  "operatingIncome",
+  "netIncome",
+  "ebitda",
+  "eps",
+  "epsDiluted",
+  "epsdiluted",
+)
+DEFAULT_BALANCE_SHEET_FIELDS = (
+  "date",
+  "period",
+  "cashAndCashEquivalents",
+  "totalCurrentAssets",
+  "totalAssets",
+  "totalCurrentLiabilities",
+  "totalLiabilities",
+  "totalDebt",
+  "netDebt",
+  "totalStockholdersEquity",
+)
+DEFAULT_CASH_FLOW_FIELDS = (
+  "date",
+  "period",
+  "operatingCashFlow",
+  "capitalExpenditure",
+  "freeCashFlow",
+  "netCashProvidedByInvestingActivities",
+  "netCashProvidedByFinancingActivities",
+  "netDividendsPaid",
+  "commonStockRepurchased",
+  "netChangeInCash",
+)
+
+T = TypeVar("T")
+
+
+def _endpoint_group(endpoint: str) -> str:
+  """Return the first path segment of an endpoint, which keys the TTL tables."""
+  return endpoint.lstrip("/").split("/", 1)[0]
+
+
+def _first(data: Any) -> Any:
+  """Unwrap the first item of a list response, leaving other payloads as is."""
+  try:
+    return data[0] if data else data
+  except (KeyError, TypeError):
+    # Dict payloads have no index 0
+    return data
+
+
+@functools.lru_cache(maxsize=256)
+def _endpoint_url(base_url: str, endpoint: str) -> str:
+  """Join a base URL and endpoint path, cached since endpoints repeat."""
+  return f"{base_url}/{endpoint.lstrip('/')}"
+
+
+@functools.lru_cache(maxsize=1)
+def _trailing_window(today: date, days: int) -> Tuple[str, str]:
+  """Return the ISO (from, to) dates of the days up to today, cached per day."""
+  return (today - timedelta(days=days)).isoformat(), today.isoformat()
+
+
+def _project(rows: Any, fields: Optional[Iterable[str]]) -> Any:
+  """Keep only the given fields of each row, or every field if none are given."""
+  if fields is None or not isinstance(rows, list):
+    return rows
+  fields = tuple(fields)
+  return [{key: row[key] for key in fields if key in row} for row in rows]
+
+
+async def _gather_bounded(
+  requests: Iterable[Awaitable[T]],
+  concurrency: int,
+) -> List[Any]:
+  """Await requests concurrently, at most `concurrency` at a time.
+
+  Failed requests hold their exception in the results rather than raising.
+  """
+  semaphore = asyncio.Semaphore(concurrency)
+
+  async def bounded(request: Awaitable[T]) -> T:
+    async with semaphore:
+      return await request
+
+  return await asyncio.gather(
+    *(bounded(request) for request in requests),
+    return_exceptions=True,
+  )
+
 
 class FMPError(Exception):
   """Custom exception for FMP API errors."""
@@ -21,11 +179,94 @@ class FMPError(Exception):
     super().__init__(f"FMP API error {status_code}: {message}")
 
 
+class FileCache:
+  """On-disk JSON response cache that survives process restarts.
+
+  Files are read and written in a worker thread so the event loop never
+  blocks on disk I/O. Any failure is treated as a cache miss.
+  """
+
+  def __init__(self, directory: Path) -> None:
+    """Initialize the cache rooted at the given directory."""
+    self.directory = directory
+
+  def _path(self, key: CacheKey) -> Path:
+    digest = hashlib.md5(repr(key).encode(), usedforsecurity=False).hexdigest()
+    return self.directory / _endpoint_group(key[1]) / f"{digest}.json"
+
+  async def get(self, key: CacheKey, ttl: float) -> Optional[Any]:
+    """Return the cached data for a request if younger than ttl seconds."""
+    return await asyncio.to_thread(self._read, self._path(key), ttl)
+
+  async def set(self, key: CacheKey, data: Any) -> None:
+    """Store the data for a request."""
+    await asyncio.to_thread(self._write, self._path(key), data)
+
+  def _read(self, path: Path, ttl: float) -> Optional[Any]:
+    try:
+      entry = orjson.loads(path.read_bytes())
+      if time.time() - entry["cached_at"] > ttl:
+        return None
+      return entry["data"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+      # Unreadable or malformed entries are misses
+      return None
+
+  def _write(self, path: Path, data: Any) -> None:
+    try:
+      path.parent.mkdir(parents=True, exist_ok=True)
+      # Write to a uniquely named file then rename so readers never see a
+      # partial file and concurrent writers never share a temp file
+      with tempfile.NamedTemporaryFile(
+        dir=path.parent,
+        suffix=".tmp",
+        delete=False,
+      ) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+      try:
+        tmp_path.write_bytes(orjson.dumps({"cached_at": time.time(), "data": data}))
+        tmp_path.replace(path)
+      except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    except OSError as e:
+      logger.warning("Failed to write FMP disk cache %s: %s", path, e)
+
+
+@dataclass(slots=True)
+class Fundamentals:
+  """Fundamental data for a symbol.
+
+  Each field holds the endpoint's data, or the exception raised fetching it.
+  """
+
+  profile: Any
+  quote: Any
+  income_statement: Any
+  balance_sheet: Any
+  cash_flow: Any
+  key_metrics: Any
+  financial_ratios: Any
+
+
 class FMPClient:
   """Financial Modeling Prep API client."""
 
-  def __init__(self, api_key: Optional[str] = None) -> None:
-    """Initialize the FMP client."""
+  def __init__(
+    self,
+    api_key: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+    *,
+    disk_cache: bool = True,
+  ) -> None:
+    """Initialize the FMP client.
+
+    Args:
+        api_key: FMP API key, defaults to the FMP_API_KEY environment variable
+        cache_dir: Disk cache directory, defaults to FMP_CACHE_DIR or
+            ~/.cache/open-deep-research/fmp
+        disk_cache: Whether to persist slow-moving responses to disk
+    """
     self.api_key = api_key or os.getenv("FMP_API_KEY")
     if not self.api_key:
       raise ValueError(
@@ -36,52 +277,189 @@ class FMPClient:
     self.v3_url = "https://financialmodelingprep.com/api/v3"
     self.timeout = 30
 
+    # Pooled HTTP/2 client reused across requests, created lazily on first use
+    self._client: Optional[httpx.AsyncClient] = None
+    self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # Responses by request, with their expiry on the time.monotonic() clock
+    self._cache: Dict[CacheKey, Tuple[float, Any]] = {}
+    # Requests currently in flight, awaited by concurrent identical callers
+    self._inflight: Dict[CacheKey, asyncio.Task] = {}
+    # Second cache level for slow-moving endpoints, shared across processes
+    self._file_cache = (
+      FileCache(Path(cache_dir or os.getenv("FMP_CACHE_DIR") or DEFAULT_DISK_CACHE_DIR))
+      if disk_cache
+      else None
+    )
+
+  async def __aenter__(self) -> "FMPClient":
+    """Enter the client context."""
+    return self
+
+  async def __aexit__(self, *exc_info: object) -> None:
+    """Close the pooled client on context exit."""
+    await self.close()
+
+  async def close(self) -> None:
+    """Close the pooled HTTP client."""
+    if self._client and not self._client.is_closed:
+      await self._client.aclose()
+    self._client = None
+    self._client_loop = None
+    self._inflight.clear()
+
+  def clear_cache(self) -> None:
+    """Drop all cached responses."""
+    self._cache.clear()
+
+  async def _get_client(self) -> httpx.AsyncClient:
+    """Return the pooled client, creating it for the running event loop."""
+    loop = asyncio.get_running_loop()
+    # Connections are bound to the loop they were opened on
+    if self._client is None or self._client.is_closed or self._client_loop is not loop:
+      stale_client = self._client
+      # HTTP/2 multiplexes concurrent requests over one TLS connection
+      self._client = httpx.AsyncClient(
+        http2=True,
+        verify=_SSL_CONTEXT,
+        limits=httpx.Limits(
+          max_connections=100,
+          max_keepalive_connections=50,
+          keepalive_expiry=60,
+        ),
+        timeout=httpx.Timeout(self.timeout),
+      )
+      self._client_loop = loop
+      # In-flight tasks belong to the previous loop
+      self._inflight.clear()
+      # Swapped in first so concurrent callers never close the stale client twice
+      if stale_client is not None and not stale_client.is_closed:
+        try:
+          await stale_client.aclose()
+        except (httpx.HTTPError, OSError, RuntimeError) as e:
+          # Its connections may belong to a loop that has already closed
+          logger.debug("Failed to close stale FMP HTTP client: %s", e)
+    return self._client
+
   async def _make_request(
     self,
     endpoint: str,
     params: Optional[Dict[str, Any]] = None,
     use_stable: bool = False,
+  ) -> Any:
+    """Make a cached HTTP request to the FMP API.
+
+    Fresh cached responses are returned without a request, and concurrent
+    identical requests share a single upstream call. Errors are not cached.
+    Cached data is shared between callers, so treat it as read-only.
+    """
+    key: CacheKey = (use_stable, endpoint, tuple(sorted((params or {}).items())))
+
+    cached = self._cache.get(key)
+    if cached is not None:
+      expires_at, data = cached
+      if expires_at > time.monotonic():
+        return data
+      del self._cache[key]
+
+    task = self._inflight.get(key)
+    if task is None:
+      task = asyncio.ensure_future(
+        self._load(key, endpoint, params, use_stable=use_stable),
+      )
+      self._inflight[key] = task
+      task.add_done_callback(lambda done: self._on_fetch_done(key, endpoint, done))
+
+    # Shield the shared task so one cancelled caller doesn't cancel the others
+    return await asyncio.shield(task)
+
+  def _on_fetch_done(self, key: CacheKey, endpoint: str, task: asyncio.Task) -> None:
+    """Cache a successful response and release its in-flight slot."""
+    if self._inflight.get(key) is task:
+      del self._inflight[key]
+
+    if task.cancelled() or task.exception() is not None:
+      return
+
+    ttl = CACHE_TTLS.get(_endpoint_group(endpoint), DEFAULT_CACHE_TTL)
+    self._cache.pop(key, None)
+    if len(self._cache) >= CACHE_MAX_ENTRIES:
+      # Dicts keep insertion order, so the first key is the oldest entry
+      del self._cache[next(iter(self._cache))]
+    self._cache[key] = (time.monotonic() + ttl, task.result())
+
+  async def _load(
+    self,
+    key: CacheKey,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    *,
+    use_stable: bool,
+  ) -> Any:
+    """Load a response from the disk cache, fetching and storing it on a miss."""
+    disk_ttl = DISK_CACHE_TTLS.get(_endpoint_group(endpoint))
+    if self._file_cache is None or disk_ttl is None:
+      return await self._fetch(endpoint, params, use_stable=use_stable)
+
+    data = await self._file_cache.get(key, disk_ttl)
+    if data is None:
+      data = await self._fetch(endpoint, params, use_stable=use_stable)
+      await self._file_cache.set(key, data)
+    return data
+
+  async def _fetch(
+    self,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    *,
+    use_stable: bool,
   ) -> Any:
     """Make an HTTP request to the FMP API."""
     base_url = self.stable_url if use_stable else self.v3_url
-    url = f"{base_url}/{endpoint.lstrip('/')}"
+    url = _endpoint_url(base_url, endpoint)
     request_params = {"apikey": self.api_key}
     if params:
       request_params.update(params)
 
-    # Create SSL context that doesn't verify certificates
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
+    try:
+      client = await self._get_client()
+      response = await client.get(url, params=request_params)
+      body = response.content
+      if response.status_code not in (200, 201):
+        # Only decode the start of the body, error pages can be large
+        raise FMPError(response.status_code, body[:512].decode("utf-8", "replace"))
 
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
+      # orjson parses the raw body directly, skipping the text decode
+      data = orjson.loads(body) if body else None
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+      raise FMPError(500, str(e))
 
-    async with aiohttp.ClientSession(connector=connector) as session:
-      try:
-        async with session.get(
-          url,
-          params=request_params,
-          timeout=self.timeout,
-        ) as response:
-          if response.status not in [200, 201]:
-            error_text = await response.text()
-            raise FMPError(response.status, error_text)
-
-          data = await response.json()
-          good_status_codes = [200, 201]
-          if not data and response.status in good_status_codes:
-            raise FMPError(404, "No data found")
-
-          return data
-      except aiohttp.ClientError as e:
-        raise FMPError(500, str(e))
+    if not data:
+      raise FMPError(404, "No data found")
+
+    return data
 
   # Company Profile and Information
   async def get_company_profile(self, symbol: str) -> Dict[str, Any]:
     """Get company profile information."""
     params = {"symbol": symbol}
     data = await self._make_request("profile", params, use_stable=True)
-    return data[0] if isinstance(data, list) and data else data
+    return _first(data)
+
+  async def get_company_profiles(
+    self,
+    symbols: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+  ) -> List[Any]:
+    """Get company profiles for several symbols concurrently.
+
+    Returns:
+        Profile, or the exception raised fetching it, for each symbol in order
+    """
+    return await _gather_bounded(
+      (self.get_company_profile(symbol) for symbol in symbols),
+      concurrency,
+    )
 
   # Stock Quotes
   async def get_quote(self, symbol: str) -> Dict[str, Any]:
@@ -90,7 +468,22 @@ class FMPClient:
     Use ^ prefix for major indices: ^GSPC, ^IXIC, ^DJI, ^VIX, ^SPX
     """
     data = await self._make_request(f"quote/{symbol}")
-    return data[0] if isinstance(data, list) and data else data
+    return _first(data)
+
+  async def get_quotes(
+    self,
+    symbols: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+  ) -> List[Any]:
+    """Get stock quotes for several symbols concurrently.
+
+    Returns:
+        Quote, or the exception raised fetching it, for each symbol in order
+    """
+    return await _gather_bounded(
+      (self.get_quote(symbol) for symbol in symbols),
+      concurrency,
+    )
 
   async def get_eod_quotes(
     self,
@@ -122,6 +515,38 @@ class FMPClient:
     )
     return data if isinstance(data, list) else [data] if data else []
 
+  async def get_fundamentals(
+    self,
+    symbol: str,
+    period: str = "annual",
+    limit: int = 5,
+    concurrency: int = 8,
+  ) -> Fundamentals:
+    """Fetch profile, quote, statements, metrics and ratios concurrently.
+
+    Args:
+        symbol: Stock symbol (e.g., AAPL, GOOGL, MSFT)
+        period: Statement period, annual or quarter
+        limit: Number of statement periods to return
+        concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        Fundamentals, with failed endpoints holding their exception
+    """
+    results = await _gather_bounded(
+      (
+        self.get_company_profile(symbol),
+        self.get_quote(symbol),
+        self.get_income_statement(symbol, period, limit),
+        self.get_balance_sheet(symbol, period, limit),
+        self.get_cash_flow(symbol, period, limit),
+        self.get_key_metrics(symbol, period, limit),
+        self.get_financial_ratios(symbol, period, limit),
+      ),
+      concurrency,
+    )
+    return Fundamentals(*results)
+
   # Economic Data
   async def get_economic_events(
     self,
@@ -131,16 +556,16 @@ class FMPClient:
     countries: Optional[List[str]] = None,
   ) -> List[Dict[str, Any]]:
     """Get economic events for a date range."""
-    # Validate date range (max 30 days)
-    from_dt = datetime.strptime(from_date, "%Y-%m-%d")
-    to_dt = datetime.strptime(to_date, "%Y-%m-%d")
+    # Validate date range (max 30 days); fromisoformat parses YYYY-MM-DD
+    # far faster than strptime and still rejects malformed dates
+    from_dt = date.fromisoformat(from_date)
+    to_dt = date.fromisoformat(to_date)
 
-    max_days = 30
-    if (to_dt - from_dt).days > max_days:
-      to_date = (from_dt + timedelta(days=max_days)).strftime("%Y-%m-%d")
+    if to_dt - from_dt > ECONOMIC_EVENTS_MAX_RANGE:
+      to_date = (from_dt + ECONOMIC_EVENTS_MAX_RANGE).isoformat()
       logger.warning(
         "Date range limited to %s days, adjusted to: %s to %s",
-        max_days,
+        ECONOMIC_EVENTS_MAX_RANGE.days,
         from_date,
         to_date,
       )
@@ -150,20 +575,20 @@ class FMPClient:
 
     # Filter by impact and countries if provided
     if impact or countries:
-      impact = impact or ["High", "Medium"]
-      countries = countries or ["US", "EA"]
+      # Sets give O(1) membership tests for each of the calendar's events
+      impact_set = frozenset(impact or ("High", "Medium"))
+      country_set = frozenset(countries or ("US", "EA"))
 
       return [
         event
         for event in data
-        if event.get("impact") in impact and event.get("country") in countries
+        if event.get("impact") in impact_set and event.get("country") in country_set
       ]
     return data
 
   async def get_treasury_rates(self) -> List[Dict[str, Any]]:
     """Get treasury rates for the past 30 days."""
-    to_date = datetime.now().strftime("%Y-%m-%d")
-    from_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+    from_date, to_date = _trailing_window(date.today(), 30)
 
     params = {"from": from_date, "to": to_date}
     return await self._make_request("treasury-rates", params, use_stable=True)
@@ -174,30 +599,90 @@ class FMPClient:
     symbol: str,
     period: str = "annual",
     limit: int = 5,
+    fields: Optional[Iterable[str]] = None,
   ) -> List[Dict[str, Any]]:
-    """Get income statement data."""
+    """Get income statement data, optionally limited to the given fields."""
     params = {"symbol": symbol, "period": period, "limit": str(limit)}
-    return await self._make_request("income-statement", params, use_stable=True)
+    data = await self._make_request("income-statement", params, use_stable=True)
+    return _project(data, fields)
 
   async def get_balance_sheet(
     self,
     symbol: str,
     period: str = "annual",
     limit: int = 5,
+    fields: Optional[Iterable[str]] = None,
   ) -> List[Dict[str, Any]]:
-    """Get balance sheet data."""
+    """Get balance sheet data, optionally limited to the given fields."""
     params = {"symbol": symbol, "period": period, "limit": str(limit)}
-    return await self._make_request("balance-sheet-statement", params, use_stable=True)
+    data = await self._make_request("balance-sheet-statement", params, use_stable=True)
+    return _project(data, fields)
 
   async def get_cash_flow(
     self,
     symbol: str,
     period: str = "annual",
     limit: int = 5,
+    fields: Optional[Iterable[str]] = None,
   ) -> List[Dict[str, Any]]:
-    """Get cash flow statement data."""
+    """Get cash flow statement data, optionally limited to the given fields."""
     params = {"symbol": symbol, "period": period, "limit": str(limit)}
-    return await self._make_request("cash-flow-statement", params, use_stable=True)
+    data = await self._make_request("cash-flow-statement", params, use_stable=True)
+    return _project(data, fields)
+
+  async def get_income_statement_batch(
+    self,
+    symbols: List[str],
+    period: str = "annual",
+    limit: int = 5,
+    fields: Optional[Iterable[str]] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+  ) -> List[Any]:
+    """Get income statements for several symbols concurrently.
+
+    Returns:
+        Statements, or the exception raised fetching them, for each symbol in order
+    """
+    return await _gather_bounded(
+      (self.get_income_statement(symbol, period, limit, fields) for symbol in symbols),
+      concurrency,
+    )
+
+  async def get_balance_sheet_batch(
+    self,
+    symbols: List[str],
+    period: str = "annual",
+    limit: int = 5,
+    fields: Optional[Iterable[str]] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+  ) -> List[Any]:
+    """Get balance sheets for several symbols concurrently.
+
+    Returns:
+        Statements, or the exception raised fetching them, for each symbol in order
+    """
+    return await _gather_bounded(
+      (self.get_balance_sheet(symbol, period, limit, fields) for symbol in symbols),
+      concurrency,
+    )
+
+  async def get_cash_flow_batch(
+    self,
+    symbols: List[str],
+    period: str = "annual",
+    limit: int = 5,
+    fields: Optional[Iterable[str]] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+  ) -> List[Any]:
+    """Get cash flow statements for several symbols concurrently.
+
+    Returns:
+        Statements, or the exception raised fetching them, for each symbol in order
+    """
+    return await _gather_bounded(
+      (self.get_cash_flow(symbol, period, limit, fields) for symbol in symbols),
+      concurrency,
+    )
 
   # Key Metrics
   async def get_key_metrics(
@@ -210,6 +695,23 @@ class FMPClient:
     params = {"symbol": symbol, "period": period, "limit": str(limit)}
     return await self._make_request("key-metrics", params, use_stable=True)
 
+  async def get_key_metrics_batch(
+    self,
+    symbols: List[str],
+    period: str = "annual",
+    limit: int = 5,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+  ) -> List[Any]:
+    """Get key financial metrics for several symbols concurrently.
+
+    Returns:
+        Metrics, or the exception raised fetching them, for each symbol in order
+    """
+    return await _gather_bounded(
+      (self.get_key_metrics(symbol, period, limit) for symbol in symbols),
+      concurrency,
+    )
+
   async def get_financial_ratios(
     self,
     symbol: str,
@@ -1,52 +1,81 @@
 """Financial Modeling Prep API tools for Open Deep Research."""
 
-import json
+import asyncio
+import functools
+import inspect
 import logging
-from datetime import datetime
-from typing import List, Optional
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 
+import orjson
 from langchain_core.runnables import RunnableConfig
-from langchain_core.tools import tool
-
-from .client import FMPClient, FMPError
+from langchain_core.tools import BaseTool, tool
+
+from .client import (
+  DEFAULT_BALANCE_SHEET_FIELDS,
+  DEFAULT_CASH_FLOW_FIELDS,
+  DEFAULT_INCOME_FIELDS,
+  FMPClient,
+  FMPError,
+)
 
 logger = logging.getLogger(__name__)
 
+# Base URL cited in tool responses
+FMP_BASE_URL = "https://financialmodelingprep.com/api/v3"
+
+
+@functools.lru_cache(maxsize=1)
+def _retrieved_at(epoch_second: int) -> str:
+  """Format a UTC retrieval timestamp, shared by responses within the same second."""
+  return datetime.fromtimestamp(epoch_second, timezone.utc).isoformat(
+    sep=" ",
+    timespec="seconds",
+  )
+
 
 def _format_fmp_response(
   data: dict | list,
   symbol: str,
   endpoint_name: str,
   api_endpoint: str,
+  *,
+  pretty: bool = False,
 ) -> str:
   """Format FMP API response with citation-friendly source attribution.
 
+  The data is emitted as compact JSON by default, since it goes straight to
+  an LLM and indentation only adds tokens.
+
   Args:
       data: The JSON data from FMP API
       symbol: Stock symbol (if applicable)
       endpoint_name: Human-readable endpoint name
       api_endpoint: Actual API endpoint path
+      pretty: Indent the JSON for human debugging
 
   Returns:
       Formatted string with data and inline citations
   """
-  timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-  base_url = "https://financialmodelingprep.com/api/v3"
-  full_url = f"{base_url}{api_endpoint}"
+  timestamp = _retrieved_at(int(time.time()))
+  symbol_suffix = f" ({symbol})" if symbol else ""
+  option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+  body = orjson.dumps(data, option=option)
 
   # Create citation-friendly format
-  source_title = f"Financial Modeling Prep - {endpoint_name}"
-  if symbol:
-    source_title += f" ({symbol})"
-  source_title += f" - Retrieved {timestamp}"
-
-  return f"""{json.dumps(data, indent=2)}
-
-Source: {source_title}: {full_url}"""
+  return (
+    f"{body.decode()}\n\n"
+    f"Source: Financial Modeling Prep - {endpoint_name}{symbol_suffix} - "
+    f"Retrieved {timestamp}: {FMP_BASE_URL}{api_endpoint}"
+  )
 
 
+@functools.lru_cache(maxsize=1)
 def _get_fmp_client() -> FMPClient:
-  """Get FMP client instance."""
+  """Get the shared FMP client instance, so tool calls reuse its connection pool."""
   try:
     return FMPClient()
   except ValueError:
@@ -54,9 +83,80 @@ def _get_fmp_client() -> FMPClient:
     raise
 
 
+async def close_fmp_client() -> None:
+  """Close the shared FMP client's connections, e.g. on application shutdown."""
+  if _get_fmp_client.cache_info().currsize:
+    await _get_fmp_client().close()
+    _get_fmp_client.cache_clear()
+
+
+def _results_by_symbol(
+  symbols: List[str],
+  results: List[Any],
+  error_message: str,
+) -> Dict[str, Any]:
+  """Map each symbol to its result, replacing failures with an error message."""
+  by_symbol = {}
+  for symbol, result in zip(symbols, results, strict=True):
+    if isinstance(result, BaseException):
+      logger.error("FMP batch request failed for %s: %s", symbol, result)
+      by_symbol[symbol] = {"error": f"{error_message} for {symbol}"}
+    else:
+      by_symbol[symbol] = result
+  return by_symbol
+
+
+def _fmp_tool(
+  description: str,
+  error_message: str,
+) -> Callable[[Callable[..., Awaitable[str]]], BaseTool]:
+  """Turn an FMP tool coroutine into a tool with shared error handling.
+
+  The decorated coroutine only fetches and formats its data. Failures are
+  logged here and replaced with error_message, formatted with the call's
+  arguments, and every call's duration is logged at debug level.
+
+  Args:
+      description: Tool description shown to the model
+      error_message: Message returned on failure, e.g. "Error getting quote for {symbol}"
+
+  Returns:
+      Decorator that registers the coroutine as a tool
+  """
+
+  def decorator(func: Callable[..., Awaitable[str]]) -> BaseTool:
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+      started = time.perf_counter()
+      try:
+        return await func(*args, **kwargs)
+      except FMPError as e:
+        # Expected outcomes such as unknown symbols or plan limits, no traceback
+        logger.warning("FMP API error in %s: %s", func.__name__, e)
+      except Exception:
+        logger.exception("Unexpected error in %s", func.__name__)
+      finally:
+        logger.debug("%s took %.3fs", func.__name__, time.perf_counter() - started)
+
+      arguments = signature.bind_partial(*args, **kwargs).arguments
+      return error_message.format_map(
+        {
+          name: ", ".join(value) if isinstance(value, list) else value
+          for name, value in arguments.items()
+        },
+      )
+
+    return tool(description=description)(wrapper)
+
+  return decorator
+
+
 # Company Information Tools
-@tool(
+@_fmp_tool(
   description="Get comprehensive company profile information including CEO, market cap, industry, sector, and business description",
+  error_message="Error getting company profile for {symbol}",
 )
 async def get_company_profile(
   symbol: str, _: RunnableConfig = None,
@@ -72,30 +172,54 @@ async def get_company_profile(
   """
   logger.info("Getting company profile for %s", symbol)
 
-  try:
-    client = _get_fmp_client()
-    company = await client.get_company_profile(symbol)
-
-    return _format_fmp_response(
-      data=company,
-      symbol=symbol,
-      endpoint_name="Company Profile",
-      api_endpoint=f"/profile/{symbol}",
-    )
+  client = _get_fmp_client()
+  company = await client.get_company_profile(symbol)
+
+  return _format_fmp_response(
+    data=company,
+    symbol=symbol,
+    endpoint_name="Company Profile",
+    api_endpoint=f"/profile/{symbol}",
+  )
+
+
+@_fmp_tool(
+  description="Get company profiles for several stock symbols at once; faster than calling get_company_profile per symbol",
+  error_message="Error getting company profiles for {symbols}",
+)
+async def get_company_profiles_batch(
+  symbols: List[str],
+  _: RunnableConfig = None,
+) -> str:
+  """Get company profile information for several companies concurrently.
+
+  Args:
+      symbols: Stock symbols (e.g., ["AAPL", "GOOGL", "MSFT"])
+      config: Runtime configuration (unused but kept for consistency)
+
+  Returns:
+      JSON string with company profile data keyed by symbol
+  """
+  logger.info("Getting company profiles for %s", symbols)
+
+  client = _get_fmp_client()
+  profiles = await client.get_company_profiles(symbols)
+  joined_symbols = ",".join(symbols)
 
-  except FMPError:
-    logger.exception("FMP API error for %s", symbol)
-    return f"Error getting company profile for {symbol}"
-  except Exception:
-    logger.exception("Unexpected error for %s", symbol)
-    return f"Error getting company profile for {symbol}"
+  return _format_fmp_response(
+    data=_results_by_symbol(symbols, profiles, "Error getting company profile"),
+    symbol=joined_symbols,
+    endpoint_name="Company Profiles",
+    api_endpoint=f"/profile/{joined_symbols}",
+  )
 
 
 # Stock Quote Tools
 
 
-@tool(
+@_fmp_tool(
   description="Get stock quote with price, volume, P/E ratio, market cap, year high/low for stocks and indices. Use ^ prefix for major indices (^GSPC, ^IXIC, ^DJI, ^VIX, ^SPX)",
+  error_message="Error getting quote for {symbol}",
 )
 async def get_stock_quote(
   symbol: str,
@@ -112,25 +236,51 @@ async def get_stock_quote(
   """
   logger.info("Getting quote for %s", symbol)
 
-  try:
-    client = _get_fmp_client()
-    quote = await client.get_quote(symbol)
-
-    return _format_fmp_response(
-      data=quote,
-      symbol=symbol,
-      endpoint_name="Stock Quote",
-      api_endpoint=f"/quote/{symbol}",
-    )
+  client = _get_fmp_client()
+  quote = await client.get_quote(symbol)
+
+  return _format_fmp_response(
+    data=quote,
+    symbol=symbol,
+    endpoint_name="Stock Quote",
+    api_endpoint=f"/quote/{symbol}",
+  )
+
+
+@_fmp_tool(
+  description="Get stock quotes for several stocks or indices at once; faster than calling get_stock_quote per symbol. Use ^ prefix for major indices (^GSPC, ^IXIC, ^DJI, ^VIX, ^SPX)",
+  error_message="Error getting quotes for {symbols}",
+)
+async def get_stock_quotes_batch(
+  symbols: List[str],
+  _: RunnableConfig = None,
+) -> str:
+  """Get stock quotes for several stocks and indices concurrently.
+
+  Args:
+      symbols: Stock or index symbols (e.g., ["AAPL", "MSFT", "^SPX"])
+      config: Runtime configuration (unused but kept for consistency)
+
+  Returns:
+      JSON string with stock quote data keyed by symbol
+  """
+  logger.info("Getting quotes for %s", symbols)
+
+  client = _get_fmp_client()
+  quotes = await client.get_quotes(symbols)
+  joined_symbols = ",".join(symbols)
+
+  return _format_fmp_response(
+    data=_results_by_symbol(symbols, quotes, "Error getting quote"),
+    symbol=joined_symbols,
+    endpoint_name="Stock Quotes",
+    api_endpoint=f"/quote/{joined_symbols}",
+  )
 
-  except FMPError:
-    return f"Error getting quote for {symbol}"
-  except Exception:
-    logger.exception("Unexpected error for %s", symbol)
-    return f"Error getting quote for {symbol}"
 
-@tool(
+@_fmp_tool(
   description="Get historical end-of-day price data for stocks and indices - useful for daily price analysis and long-term chart patterns. Use ^ prefix for major indices (^DJI, ^VIX, ^SPX). Use ^GSPC for ^SPX.",
+  error_message="Error getting end-of-day quotes for {symbol}",
 )
 async def get_eod_quotes(
   symbol: str,
@@ -151,38 +301,33 @@ async def get_eod_quotes(
   """
   logger.info("Getting end-of-day quotes for %s", symbol)
 
-  try:
-    client = _get_fmp_client()
-    chart_data = await client.get_eod_quotes(symbol, from_date, to_date)
-
-    # Build endpoint URL with parameters for the stable endpoint
-    endpoint = f"/stable/historical-price-eod/light?symbol={symbol}"
-    if from_date or to_date:
-      params = []
-      if from_date:
-        params.append(f"from={from_date}")
-      if to_date:
-        params.append(f"to={to_date}")
-      endpoint += f"&{'&'.join(params)}"
-
-    return _format_fmp_response(
-      data=chart_data,
-      symbol=symbol,
-      endpoint_name="End-of-Day Quotes",
-      api_endpoint=endpoint,
-    )
+  client = _get_fmp_client()
+  chart_data = await client.get_eod_quotes(symbol, from_date, to_date)
+
+  # Build endpoint URL with parameters for the stable endpoint
+  endpoint = f"/stable/historical-price-eod/light?symbol={symbol}"
+  if from_date or to_date:
+    params = []
+    if from_date:
+      params.append(f"from={from_date}")
+    if to_date:
+      params.append(f"to={to_date}")
+    endpoint += f"&{'&'.join(params)}"
 
-  except FMPError:
-    return f"Error getting end-of-day quotes for {symbol}"
-  except Exception:
-    return f"Error getting end-of-day quotes for {symbol}"
+  return _format_fmp_response(
+    data=chart_data,
+    symbol=symbol,
+    endpoint_name="End-of-Day Quotes",
+    api_endpoint=endpoint,
+  )
 
 
 # Economic Data Tools
 
 
-@tool(
+@_fmp_tool(
   description="Get economic calendar events like CPI, GDP, Fed meetings, and other market-moving events for specific date ranges",
+  error_message="Error getting economic events",
 )
 async def get_economic_events(
   from_date: str,
@@ -205,30 +350,25 @@ async def get_economic_events(
   """
   logger.info("Getting economic events from %s to %s", from_date, to_date)
 
-  try:
-    client = _get_fmp_client()
-    events = await client.get_economic_events(
-      from_date,
-      to_date,
-      impact=impact,
-      countries=countries,
-    )
+  client = _get_fmp_client()
+  events = await client.get_economic_events(
+    from_date,
+    to_date,
+    impact=impact,
+    countries=countries,
+  )
 
-    return _format_fmp_response(
-      data=events,
-      symbol="",
-      endpoint_name="Economic Calendar Events",
-      api_endpoint=f"/api/v3/economic_calendar?from={from_date}&to={to_date}",
-    )
-
-  except FMPError:
-    return "Error getting economic events"
-  except Exception:
-    return "Error getting economic events"
+  return _format_fmp_response(
+    data=events,
+    symbol="",
+    endpoint_name="Economic Calendar Events",
+    api_endpoint=f"/api/v3/economic_calendar?from={from_date}&to={to_date}",
+  )
 
 
-@tool(
+@_fmp_tool(
   description="Get current US Treasury rates for various maturities (1m, 3m, 6m, 1y, 2y, 5y, 10y, 30y) for the past 30 days",
+  error_message="Error getting treasury rates",
 )
 async def get_treasury_rates(_: RunnableConfig = None) -> str:
   """Get US Treasury rates for the past 30 days.
@@ -241,33 +381,29 @@ async def get_treasury_rates(_: RunnableConfig = None) -> str:
   """
   logger.info("Getting treasury rates")
 
-  try:
-    client = _get_fmp_client()
-    rates = await client.get_treasury_rates()
-
-    return _format_fmp_response(
-      data=rates,
-      symbol="",
-      endpoint_name="US Treasury Rates",
-      api_endpoint="/treasury",
-    )
+  client = _get_fmp_client()
+  rates = await client.get_treasury_rates()
 
-  except FMPError:
-    return "Error getting treasury rates"
-  except Exception:
-    return "Error getting treasury rates"
+  return _format_fmp_response(
+    data=rates,
+    symbol="",
+    endpoint_name="US Treasury Rates",
+    api_endpoint="/treasury",
+  )
 
 
 # Financial Statements Tools
 
 
-@tool(
-  description="Get company income statement data including revenue, gross profit, operating income, and net income for multiple periods",
+@_fmp_tool(
+  description="Get company income statement data including revenue, gross profit, operating income, and net income for multiple periods. Returns key line items unless specific FMP field names are passed in fields",
+  error_message="Error getting income statement for {symbol}",
 )
 async def get_income_statement(
   symbol: str,
   period: str = "annual",
   limit: int = 5,
+  fields: Optional[List[str]] = None,
   _: RunnableConfig = None,
 ) -> str:
   """Get income statement data for a company.
@@ -276,6 +412,7 @@ async def get_income_statement(
       symbol: Stock symbol (e.g., AAPL, GOOGL, MSFT)
       period: "annual" or "quarter"
       limit: Number of periods to retrieve (default 5)
+      fields: Statement fields to return (default: key line items)
       config: Runtime configuration (unused but kept for consistency)
 
   Returns:
@@ -283,30 +420,73 @@ async def get_income_statement(
   """
   logger.info("Getting income statement for %s", symbol)
 
-  try:
-    client = _get_fmp_client()
-    statements = await client.get_income_statement(symbol, period, limit)
-
-    return _format_fmp_response(
-      data=statements,
-      symbol=symbol,
-      endpoint_name=f"Income Statement ({period})",
-      api_endpoint=f"/income-statement/{symbol}?period={period}&limit={limit}",
-    )
-
-  except FMPError:
-    return f"Error getting income statement for {symbol}"
-  except Exception:
-    return f"Error getting income statement for {symbol}"
+  client = _get_fmp_client()
+  statements = await client.get_income_statement(
+    symbol,
+    period,
+    limit,
+    fields or DEFAULT_INCOME_FIELDS,
+  )
+
+  return _format_fmp_response(
+    data=statements,
+    symbol=symbol,
+    endpoint_name=f"Income Statement ({period})",
+    api_endpoint=f"/income-statement/{symbol}?period={period}&limit={limit}",
+  )
+
+
+@_fmp_tool(
+  description="Get income statement data for several companies at once; faster than calling get_income_statement per symbol. Returns key line items unless specific FMP field names are passed in fields",
+  error_message="Error getting income statement for {symbols}",
+)
+async def get_income_statement_batch(
+  symbols: List[str],
+  period: str = "annual",
+  limit: int = 5,
+  fields: Optional[List[str]] = None,
+  _: RunnableConfig = None,
+) -> str:
+  """Get income statement data for several companies concurrently.
 
+  Args:
+      symbols: Stock symbols (e.g., ["AAPL", "GOOGL", "MSFT"])
+      period: "annual" or "quarter"
+      limit: Number of periods to retrieve (default 5)
+      fields: Statement fields to return (default: key line items)
+      config: Runtime configuration (unused but kept for consistency)
 
-@tool(
-  description="Get company balance sheet data including total assets, liabilities, equity, and cash positions",
+  Returns:
+      JSON string with income statement data keyed by symbol
+  """
+  logger.info("Getting income statement for %s", symbols)
+
+  client = _get_fmp_client()
+  statements = await client.get_income_statement_batch(
+    symbols,
+    period,
+    limit,
+    fields or DEFAULT_INCOME_FIELDS,
+  )
+  joined_symbols = ",".join(symbols)
+
+  return _format_fmp_response(
+    data=_results_by_symbol(symbols, statements, "Error getting income statement"),
+    symbol=joined_symbols,
+    endpoint_name=f"Income Statement ({period})",
+    api_endpoint=f"/income-statement/{joined_symbols}?period={period}&limit={limit}",
+  )
+
+
+@_fmp_tool(
+  description="Get company balance sheet data including total assets, liabilities, equity, and cash positions. Returns key line items unless specific FMP field names are passed in fields",
+  error_message="Error getting balance sheet for {symbol}",
 )
 async def get_balance_sheet(
   symbol: str,
   period: str = "annual",
   limit: int = 5,
+  fields: Optional[List[str]] = None,
   _: RunnableConfig = None,
 ) -> str:
   """Get balance sheet data for a company.
@@ -315,6 +495,7 @@ async def get_balance_sheet(
       symbol: Stock symbol (e.g., AAPL, GOOGL, MSFT)
       period: "annual" or "quarter"
       limit: Number of periods to retrieve (default 5)
+      fields: Statement fields to return (default: key line items)
       config: Runtime configuration (unused but kept for consistency)
 
   Returns:
@@ -322,30 +503,73 @@ async def get_balance_sheet(
   """
   logger.info("Getting balance sheet for %s", symbol)
 
-  try:
-    client = _get_fmp_client()
-    statements = await client.get_balance_sheet(symbol, period, limit)
-
-    return _format_fmp_response(
-      data=statements,
-      symbol=symbol,
-      endpoint_name=f"Balance Sheet ({period})",
-      api_endpoint=f"/balance-sheet-statement/{symbol}?period={period}&limit={limit}",
-    )
-
-  except FMPError:
-    return f"Error getting balance sheet for {symbol}"
-  except Exception:
-    return f"Error getting balance sheet for {symbol}"
+  client = _get_fmp_client()
+  statements = await client.get_balance_sheet(
+    symbol,
+    period,
+    limit,
+    fields or DEFAULT_BALANCE_SHEET_FIELDS,
+  )
+
+  return _format_fmp_response(
+    data=statements,
+    symbol=symbol,
+    endpoint_name=f"Balance Sheet ({period})",
+    api_endpoint=f"/balance-sheet-statement/{symbol}?period={period}&limit={limit}",
+  )
+
+
+@_fmp_tool(
+  description="Get balance sheet data for several companies at once; faster than calling get_balance_sheet per symbol. Returns key line items unless specific FMP field names are passed in fields",
+  error_message="Error getting balance sheet for {symbols}",
+)
+async def get_balance_sheet_batch(
+  symbols: List[str],
+  period: str = "annual",
+  limit: int = 5,
+  fields: Optional[List[str]] = None,
+  _: RunnableConfig = None,
+) -> str:
+  """Get balance sheet data for several companies concurrently.
 
+  Args:
+      symbols: Stock symbols (e.g., ["AAPL", "GOOGL", "MSFT"])
+      period: "annual" or "quarter"
+      limit: Number of periods to retrieve (default 5)
+      fields: Statement fields to return (default: key line items)
+      config: Runtime configuration (unused but kept for consistency)
 
-@tool(
-  description="Get company cash flow statement including operating, investing, and financing cash flows plus free cash flow",
+  Returns:
+      JSON string with balance sheet data keyed by symbol
+  """
+  logger.info("Getting balance sheet for %s", symbols)
+
+  client = _get_fmp_client()
+  statements = await client.get_balance_sheet_batch(
+    symbols,
+    period,
+    limit,
+    fields or DEFAULT_BALANCE_SHEET_FIELDS,
+  )
+  joined_symbols = ",".join(symbols)
+
+  return _format_fmp_response(
+    data=_results_by_symbol(symbols, statements, "Error getting balance sheet"),
+    symbol=joined_symbols,
+    endpoint_name=f"Balance Sheet ({period})",
+    api_endpoint=f"/balance-sheet-statement/{joined_symbols}?period={period}&limit={limit}",
+  )
+
+
+@_fmp_tool(
+  description="Get company cash flow statement including operating, investing, and financing cash flows plus free cash flow. Returns key line items unless specific FMP field names are passed in fields",
+  error_message="Error getting cash flow for {symbol}",
 )
 async def get_cash_flow(
   symbol: str,
   period: str = "annual",
   limit: int = 5,
+  fields: Optional[List[str]] = None,
   _: RunnableConfig = None,
 ) -> str:
   """Get cash flow statement data for a company.
@@ -354,6 +578,7 @@ async def get_cash_flow(
       symbol: Stock symbol (e.g., AAPL, GOOGL, MSFT)
       period: "annual" or "quarter"
       limit: Number of periods to retrieve (default 5)
+      fields: Statement fields to return (default: key line items)
       config: Runtime configuration (unused but kept for consistency)
 
   Returns:
@@ -361,28 +586,128 @@ async def get_cash_flow(
   """
   logger.info("Getting cash flow for %s", symbol)
 
-  try:
-    client = _get_fmp_client()
-    statements = await client.get_cash_flow(symbol, period, limit)
-
-    return _format_fmp_response(
-      data=statements,
-      symbol=symbol,
-      endpoint_name=f"Cash Flow Statement ({period})",
-      api_endpoint=f"/cash-flow-statement/{symbol}?period={period}&limit={limit}",
+  client = _get_fmp_client()
+  statements = await client.get_cash_flow(
+    symbol,
+    period,
+    limit,
+    fields or DEFAULT_CASH_FLOW_FIELDS,
+  )
+
+  return _format_fmp_response(
+    data=statements,
+    symbol=symbol,
+    endpoint_name=f"Cash Flow Statement ({period})",
+    api_endpoint=f"/cash-flow-statement/{symbol}?period={period}&limit={limit}",
+  )
+
+
+@_fmp_tool(
+  description="Get cash flow statements for several companies at once; faster than calling get_cash_flow per symbol. Returns key line items unless specific FMP field names are passed in fields",
+  error_message="Error getting cash flow for {symbols}",
+)
+async def get_cash_flow_batch(
+  symbols: List[str],
+  period: str = "annual",
+  limit: int = 5,
+  fields: Optional[List[str]] = None,
+  _: RunnableConfig = None,
+) -> str:
+  """Get cash flow data for several companies concurrently.
+
+  Args:
+      symbols: Stock symbols (e.g., ["AAPL", "GOOGL", "MSFT"])
+      period: "annual" or "quarter"
+      limit: Number of periods to retrieve (default 5)
+      fields: Statement fields to return (default: key line items)
+      config: Runtime configuration (unused but kept for consistency)
+
+  Returns:
+      JSON string with cash flow data keyed by symbol
+  """
+  logger.info("Getting cash flow for %s", symbols)
+
+  client = _get_fmp_client()
+  statements = await client.get_cash_flow_batch(
+    symbols,
+    period,
+    limit,
+    fields or DEFAULT_CASH_FLOW_FIELDS,
+  )
+  joined_symbols = ",".join(symbols)
+
+  return _format_fmp_response(
+    data=_results_by_symbol(symbols, statements, "Error getting cash flow"),
+    symbol=joined_symbols,
+    endpoint_name=f"Cash Flow Statement ({period})",
+    api_endpoint=f"/cash-flow-statement/{joined_symbols}?period={period}&limit={limit}",
+  )
+
+
+@_fmp_tool(
+  description="Get income statement, balance sheet, and cash flow statement key line items for a company in one call; faster than calling the three statement tools separately",
+  error_message="Error getting financial statements for {symbol}",
+)
+async def get_financial_statements(
+  symbol: str,
+  period: str = "annual",
+  limit: int = 5,
+  _: RunnableConfig = None,
+) -> str:
+  """Get all three financial statements for a company concurrently.
+
+  Args:
+      symbol: Stock symbol (e.g., AAPL, GOOGL, MSFT)
+      period: "annual" or "quarter"
+      limit: Number of periods to retrieve (default 5)
+      config: Runtime configuration (unused but kept for consistency)
+
+  Returns:
+      JSON strings with each statement's data, each with its own citation
+  """
+  logger.info("Getting financial statements for %s", symbol)
+
+  client = _get_fmp_client()
+  results = await asyncio.gather(
+    client.get_income_statement(symbol, period, limit, DEFAULT_INCOME_FIELDS),
+    client.get_balance_sheet(symbol, period, limit, DEFAULT_BALANCE_SHEET_FIELDS),
+    client.get_cash_flow(symbol, period, limit, DEFAULT_CASH_FLOW_FIELDS),
+    return_exceptions=True,
+  )
+
+  sections = []
+  for (endpoint_name, endpoint), result in zip(
+    (
+      ("Income Statement", "income-statement"),
+      ("Balance Sheet", "balance-sheet-statement"),
+      ("Cash Flow Statement", "cash-flow-statement"),
+    ),
+    results,
+    strict=True,
+  ):
+    # Keep the statements that succeeded when another one fails
+    if isinstance(result, BaseException):
+      logger.error("FMP %s request failed for %s: %s", endpoint, symbol, result)
+      sections.append(f"Error getting {endpoint_name.lower()} for {symbol}")
+      continue
+    sections.append(
+      _format_fmp_response(
+        data=result,
+        symbol=symbol,
+        endpoint_name=f"{endpoint_name} ({period})",
+        api_endpoint=f"/{endpoint}/{symbol}?period={period}&limit={limit}",
+      ),
     )
 
-  except FMPError:
-    return f"Error getting cash flow for {symbol}"
-  except Exception:
-    return f"Error getting cash flow for {symbol}"
+  return "\n\n".join(sections)
 
 
 # Key Metrics and Ratios
 
 
-@tool(
+@_fmp_tool(
   description="Get key financial metrics including P/E ratio, ROE, ROA, debt ratios, and market valuation metrics",
+  error_message="Error getting key metrics for {symbol}",
 )
 async def get_key_metrics(
   symbol: str,
@@ -403,28 +728,58 @@ async def get_key_metrics(
   """
   logger.info("Getting key metrics for %s", symbol)
 
-  try:
-    client = _get_fmp_client()
-    metrics = await client.get_key_metrics(symbol, period, limit)
-
-    return _format_fmp_response(
-      data=metrics,
-      symbol=symbol,
-      endpoint_name=f"Key Financial Metrics ({period})",
-      api_endpoint=f"/key-metrics/{symbol}?period={period}&limit={limit}",
-    )
+  client = _get_fmp_client()
+  metrics = await client.get_key_metrics(symbol, period, limit)
+
+  return _format_fmp_response(
+    data=metrics,
+    symbol=symbol,
+    endpoint_name=f"Key Financial Metrics ({period})",
+    api_endpoint=f"/key-metrics/{symbol}?period={period}&limit={limit}",
+  )
+
+
+@_fmp_tool(
+  description="Get key financial metrics for several companies at once; faster than calling get_key_metrics per symbol",
+  error_message="Error getting key metrics for {symbols}",
+)
+async def get_key_metrics_batch(
+  symbols: List[str],
+  period: str = "annual",
+  limit: int = 5,
+  _: RunnableConfig = None,
+) -> str:
+  """Get key financial metrics for several companies concurrently.
+
+  Args:
+      symbols: Stock symbols (e.g., ["AAPL", "GOOGL", "MSFT"])
+      period: "annual" or "quarter"
+      limit: Number of periods to retrieve (default 5)
+      config: Runtime configuration (unused but kept for consistency)
+
+  Returns:
+      JSON string with key metrics data keyed by symbol
+  """
+  logger.info("Getting key metrics for %s", symbols)
+
+  client = _get_fmp_client()
+  metrics = await client.get_key_metrics_batch(symbols, period, limit)
+  joined_symbols = ",".join(symbols)
 
-  except FMPError:
-    return f"Error getting key metrics for {symbol}"
-  except Exception:
-    return f"Error getting key metrics for {symbol}"
+  return _format_fmp_response(
+    data=_results_by_symbol(symbols, metrics, "Error getting key metrics"),
+    symbol=joined_symbols,
+    endpoint_name=f"Key Financial Metrics ({period})",
+    api_endpoint=f"/key-metrics/{joined_symbols}?period={period}&limit={limit}",
+  )
 
 
 # Search Tools
 
 
-@tool(
+@_fmp_tool(
   description="Search for stock symbols by company name - useful when you need to find the ticker symbol for a company",
+  error_message="Error searching symbols",
 )
 async def search_stock_symbols(
   query: str,
@@ -443,25 +798,20 @@ async def search_stock_symbols(
   """
   logger.info("Searching symbols for query: %s", query)
 
-  try:
-    client = _get_fmp_client()
-    results = await client.search_symbols(query, limit)
-
-    return _format_fmp_response(
-      data=results,
-      symbol="",
-      endpoint_name="Symbol Search",
-      api_endpoint=f"/stable/search-symbol?query={query}&limit={limit}",
-    )
+  client = _get_fmp_client()
+  results = await client.search_symbols(query, limit)
 
-  except FMPError:
-    return "Error searching symbols"
-  except Exception:
-    return "Error searching symbols"
+  return _format_fmp_response(
+    data=results,
+    symbol="",
+    endpoint_name="Symbol Search",
+    api_endpoint=f"/stable/search-symbol?query={query}&limit={limit}",
+  )
 
 
-@tool(
+@_fmp_tool(
   description="Get recent news articles about specific stocks - useful for current events. Will not work for indices.",
+  error_message="Error getting stock news",
 )
 async def get_stock_news(
   symbols: Optional[List[str]] = None,
@@ -478,24 +828,17 @@ async def get_stock_news(
   Returns:
       JSON string with news articles
   """
-  symbols_str = ", ".join(symbols) if symbols else "general"
-  logger.info("Getting stock news for symbols: %s", symbols_str)
-
-  try:
-    client = _get_fmp_client()
-    news = await client.get_stock_news(symbols, limit)
-
-    symbols_param = ",".join(symbols) if symbols else ""
-    return _format_fmp_response(
-      data=news,
-      symbol=symbols_param,
-      endpoint_name="Stock News",
-      api_endpoint=f"/stable/news/stock?symbols={symbols_param}&limit={limit}"
-      if symbols
-      else f"/stable/news/stock?limit={limit}",
-    )
-
-  except FMPError:
-    return "Error getting stock news"
-  except Exception:
-    return "Error getting stock news"
+  symbols_param = ",".join(symbols) if symbols else ""
+  logger.info("Getting stock news for symbols: %s", symbols_param or "general")
+
+  client = _get_fmp_client()
+  news = await client.get_stock_news(symbols, limit)
+
+  # Encode the query so index symbols like ^GSPC still cite a valid URL
+  params = {"symbols": symbols_param, "limit": limit} if symbols else {"limit": limit}
+  return _format_fmp_response(
+    data=news,
+    symbol=symbols_param,
+    endpoint_name="Stock News",
+    api_endpoint=f"/stable/news/stock?{urlencode(params)}",
+  )
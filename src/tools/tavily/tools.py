@@ -1,13 +1,14 @@
 """Tavily search tools for Open Deep Research."""
 
 import asyncio
+import functools
 import logging
 import os
-from typing import Annotated, Dict, List, Literal
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.tools import InjectedToolArg, tool
 from open_deep_research.configuration import Configuration
 from open_deep_research.helpers import get_api_key_for_model, get_today_str
@@ -23,6 +24,35 @@ TAVILY_SEARCH_DESCRIPTION = (
   "Useful for when you need to answer questions about current events."
 )
 
+
+@functools.lru_cache(maxsize=4)
+def _get_tavily_client(api_key: str) -> AsyncTavilyClient:
+  """Get a shared Tavily client for the API key instead of one per search."""
+  return AsyncTavilyClient(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_summarization_model(
+  model: str,
+  max_tokens: int,
+  max_retries: int,
+  api_key: Optional[str],
+) -> Runnable:
+  """Get a structured-output summarization model, built once per settings."""
+  return (
+    init_chat_model(
+      model=model,
+      max_tokens=max_tokens,
+      api_key=api_key,
+      tags=["langsmith:nostream"],
+    )
+    .with_structured_output(Summary)
+    .with_retry(
+      stop_after_attempt=max_retries,
+    )
+  )
+
+
 @tool(description=TAVILY_SEARCH_DESCRIPTION)
 async def tavily_search(
   queries: List[str],
@@ -47,23 +77,7 @@ async def tavily_search(
   # Add logging to see when tool is called
   logger.info("Tavily Tool called with queries: %s", queries)
 
-  # Step 1: Execute search queries asynchronously
-  search_results = await tavily_search_async(
-    queries,
-    max_results=max_results,
-    topic=topic,
-    include_raw_content=True,
-  )
-
-  # Step 2: Deduplicate results by URL to avoid processing the same content multiple times
-  unique_results = {}
-  for response in search_results:
-    for result in response["results"]:
-      url = result["url"]
-      if url not in unique_results:
-        unique_results[url] = {**result, "query": response["query"]}
-
-  # Step 3: Set up the summarization model with configuration
+  # Step 1: Set up the summarization model with configuration
   configurable = Configuration.from_runnable_config(config)
 
   # Character limit to stay within model token limits (configurable)
@@ -71,46 +85,76 @@ async def tavily_search(
 
   # Initialize summarization model with retry logic
   model_api_key = get_api_key_for_model(configurable.summarization_model, config)
-  summarization_model = (
-    init_chat_model(
-      model=configurable.summarization_model,
-      max_tokens=configurable.summarization_model_max_tokens,
-      api_key=model_api_key,
-      tags=["langsmith:nostream"],
-    )
-    .with_structured_output(Summary)
-    .with_retry(
-      stop_after_attempt=configurable.max_structured_output_retries,
-    )
+  summarization_model = _get_summarization_model(
+    configurable.summarization_model,
+    configurable.summarization_model_max_tokens,
+    configurable.max_structured_output_retries,
+    model_api_key,
   )
 
-  # Step 4: Create summarization tasks (skip empty content)
-  async def noop() -> Summary:
-    """No-op function for results without raw content."""
-    return Summary(summary="", key_excerpts="")
-
-  summarization_tasks = [
-    summarization_model.ainvoke(
-      [
-        HumanMessage(
-          content=summarize_webpage_prompt.format(
-            webpage_content=result.get("raw_content", "")[:max_char_to_include],
-            date=get_today_str(),
+  # Bound concurrent summaries to respect the summarization model's rate limits
+  semaphore = asyncio.Semaphore(configurable.max_concurrent_summaries)
+
+  async def summarize(result: Dict) -> Summary:
+    """Summarize a result's raw content, skipping results without any."""
+    if not result.get("raw_content"):
+      return Summary(summary="", key_excerpts="")
+    async with semaphore:
+      return await summarization_model.ainvoke(
+        [
+          HumanMessage(
+            content=summarize_webpage_prompt.format(
+              webpage_content=result["raw_content"][:max_char_to_include],
+              date=get_today_str(),
+            ),
           ),
-        ),
-      ],
+        ],
+      )
+
+  # Step 2: Run one search per query and start summarizing each new URL as
+  # soon as its search returns, overlapping the remaining searches
+  search_tasks = [
+    asyncio.create_task(
+      tavily_search_async(
+        [query],
+        max_results=max_results,
+        topic=topic,
+        include_raw_content=True,
+      ),
     )
-    if result.get("raw_content")
-    else noop()
-    for result in unique_results.values()
+    for query in queries
   ]
-
-  # Step 5: Execute all summarization tasks concurrently
-  summaries = await asyncio.gather(*summarization_tasks)
-
-  # Step 6: Format and return results
+  # URL -> the first result that arrived for it and the task summarizing it
+  summary_tasks: Dict[str, Tuple[Dict, asyncio.Task]] = {}
+  try:
+    for search in asyncio.as_completed(search_tasks):
+      for response in await search:
+        for result in response["results"]:
+          if result["url"] not in summary_tasks:
+            summary_tasks[result["url"]] = (
+              result,
+              asyncio.create_task(summarize(result)),
+            )
+
+    # Step 3: Order unique URLs by query, so the output does not depend on which
+    # search finished first, keeping the result that was actually summarized
+    unique_results = {}
+    for search_task in search_tasks:
+      for response in search_task.result():
+        for result in response["results"]:
+          unique_results.setdefault(result["url"], summary_tasks[result["url"]])
+
+    # Step 4: Wait for the summaries still in flight
+    summaries = await asyncio.gather(*(task for _, task in unique_results.values()))
+  finally:
+    # Stop the searches and summaries left running if this call fails or is
+    # cancelled; finished tasks ignore cancel()
+    for task in (*search_tasks, *(summary for _, summary in summary_tasks.values())):
+      task.cancel()
+
+  # Step 5: Format and return results
   formatted_results = []
-  for result, summary in zip(unique_results.values(), summaries, strict=False):
+  for (result, _), summary in zip(unique_results.values(), summaries, strict=False):
     if summary is None:
       # Use basic result info when no raw content is available
       formatted_result = f"Title: {result.get('title', 'No title')}\n"
@@ -153,7 +197,7 @@ async def tavily_search_async(
       for query in queries
     ]
 
-  tavily = AsyncTavilyClient(api_key=api_key)
+  tavily = _get_tavily_client(api_key)
 
   # Create search tasks for all queries
   search_tasks = [
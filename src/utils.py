@@ -1,5 +1,11 @@
 """Simplified utility functions for the Deep Research agent."""
 
+import asyncio
+import contextlib
+import functools
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import List, Optional
 
 import aiohttp
@@ -18,14 +24,21 @@ from open_deep_research.state import ResearchComplete
 # Import all FMP tools from the tools package
 from open_deep_research.tools.fmp.tools import (
   get_balance_sheet,
+  get_balance_sheet_batch,
   get_cash_flow,
+  get_cash_flow_batch,
   get_company_profile,
+  get_company_profiles_batch,
   get_economic_events,
   get_eod_quotes,
+  get_financial_statements,
   get_income_statement,
+  get_income_statement_batch,
   get_key_metrics,
+  get_key_metrics_batch,
   get_stock_news,
   get_stock_quote,
+  get_stock_quotes_batch,
   get_treasury_rates,
 )
 
@@ -39,6 +52,65 @@ from open_deep_research.tools.tavily.tools import tavily_search
 ##########################
 
 
+@dataclass
+class _MCPSession:
+  """Shared MCP HTTP session, so tool calls reuse keep-alive connections."""
+
+  session: Optional[aiohttp.ClientSession] = None
+  # Connections are bound to the loop they were opened on
+  loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+_mcp_session = _MCPSession()
+
+
+async def _get_mcp_session() -> aiohttp.ClientSession:
+  """Return the pooled MCP session, creating it for the running event loop."""
+  loop = asyncio.get_running_loop()
+  stale_session = _mcp_session.session
+  if stale_session is None or stale_session.closed or _mcp_session.loop is not loop:
+    _mcp_session.session = aiohttp.ClientSession(
+      connector=aiohttp.TCPConnector(
+        limit=100,
+        keepalive_timeout=120,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+      ),
+      timeout=aiohttp.ClientTimeout(total=30),
+    )
+    _mcp_session.loop = loop
+    # Swapped in first so concurrent callers never close the stale session twice
+    if stale_session is not None and not stale_session.closed:
+      # Its connections may belong to a loop that has already closed
+      with contextlib.suppress(aiohttp.ClientError, OSError, RuntimeError):
+        await stale_session.close()
+  return _mcp_session.session
+
+
+async def close_mcp_session() -> None:
+  """Close the shared MCP session's connections, e.g. on application shutdown."""
+  session = _mcp_session.session
+  _mcp_session.session = None
+  _mcp_session.loop = None
+  if session and not session.closed:
+    await session.close()
+
+
+# Map tool names to actual endpoints
+MCP_TOOL_ENDPOINTS = MappingProxyType(
+  {
+    "get_company_profile": "/financial/company_profile",
+  },
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _mcp_tool_url(mcp_url: str, tool_name: str) -> str:
+  """Build a tool's endpoint URL, cached since both inputs repeat."""
+  # A trailing slash would produce "//" and can trigger a redirect
+  return f"{mcp_url.rstrip('/')}{MCP_TOOL_ENDPOINTS[tool_name]}"
+
+
 async def simple_mcp_tool_call(tool_name: str, args: dict, mcp_url: str) -> str:
   """Make a simple HTTP call to MCP server tool.
 
@@ -52,27 +124,52 @@ async def simple_mcp_tool_call(tool_name: str, args: dict, mcp_url: str) -> str:
   """
   good_status_codes = [200, 201]
   try:
-    async with aiohttp.ClientSession() as session:
-      # Map tool names to actual endpoints
-      endpoint_map = {
-        "get_company_profile": "/financial/company_profile",
-      }
-
-      if tool_name in endpoint_map:
-        tool_url = f"{mcp_url.rstrip('')}{endpoint_map[tool_name]}"
-        # Use GET for FastAPI endpoints with query parameters
-        params = args
-        async with session.get(tool_url, params=params) as response:
-          if response.status in good_status_codes:
-            return await response.text()
-          return f"Error calling tool {tool_name}: HTTP {response.status}"
-      else:
-        return f"Unknown tool: {tool_name}"
+    if tool_name in MCP_TOOL_ENDPOINTS:
+      tool_url = _mcp_tool_url(mcp_url, tool_name)
+      # Use GET for FastAPI endpoints with query parameters
+      params = args
+      session = await _get_mcp_session()
+      async with session.get(tool_url, params=params) as response:
+        if response.status in good_status_codes:
+          return await response.text()
+        return f"Error calling tool {tool_name}: HTTP {response.status}"
+    else:
+      return f"Unknown tool: {tool_name}"
 
   except Exception as e:
     return f"Error calling tool {tool_name}: {e!s}"
 
 
+@functools.lru_cache(maxsize=32)
+def _build_simple_mcp_tools(
+  mcp_url: str,
+  tool_names: tuple[str, ...],
+) -> tuple[BaseTool, ...]:
+  """Build the MCP tools for a server once, since building their schemas is costly."""
+
+  # Create a simple tool that calls the MCP server
+  def make_tool_func(name: str):
+    async def tool_func(**kwargs):
+      return await simple_mcp_tool_call(name, kwargs, mcp_url)
+
+    return tool_func
+
+  tools = []
+  for tool_name in tool_names:
+    tool_func = make_tool_func(tool_name)
+
+    tool = StructuredTool.from_function(
+      func=tool_func,
+      name=tool_name,
+      description=f"Financial tool: {tool_name}",
+      coroutine=tool_func,
+    )
+
+    tools.append(tool)
+
+  return tuple(tools)
+
+
 async def load_simple_mcp_tools(
   config: RunnableConfig,
   existing_tool_names: set[str],
@@ -91,33 +188,12 @@ async def load_simple_mcp_tools(
   if not configurable.mcp_config or not configurable.mcp_config.url:
     return []
 
-  mcp_url = configurable.mcp_config.url
-  tools = []
-
-  # Create simple tools for each configured tool
-  for tool_name in configurable.mcp_config.tools or []:
-    if tool_name in existing_tool_names:
-      continue
-
-    # Create a simple tool that calls the MCP server
-    async def make_tool_func(name):
-      async def tool_func(**kwargs):
-        return await simple_mcp_tool_call(name, kwargs, mcp_url)
-
-      return tool_func
-
-    tool_func = await make_tool_func(tool_name)
-
-    tool = StructuredTool.from_function(
-      func=tool_func,
-      name=tool_name,
-      description=f"Financial tool: {tool_name}",
-      coroutine=tool_func,
-    )
-
-    tools.append(tool)
-
-  return tools
+  tool_names = tuple(configurable.mcp_config.tools or ())
+  return [
+    tool
+    for tool in _build_simple_mcp_tools(configurable.mcp_config.url, tool_names)
+    if tool.name not in existing_tool_names
+  ]
 
 
 ##########################
@@ -159,33 +235,31 @@ def get_model_token_limit(model_name: str) -> Optional[int]:
   return model_limits.get(clean_model)
 
 
+# Error message fragments that indicate a token limit was exceeded, matched
+# in a single case-insensitive scan
+TOKEN_LIMIT_PATTERN = re.compile(
+  "token limit|context length|maximum context|too many tokens|context window",
+  re.IGNORECASE,
+)
+
+
 def is_token_limit_exceeded(error: Exception, _: str) -> bool:
   """Check if an error indicates token limit was exceeded."""
-  error_str = str(error).lower()
-  token_limit_indicators = [
-    "token limit",
-    "context length",
-    "maximum context",
-    "too many tokens",
-    "context window",
-  ]
-
-  return any(indicator in error_str for indicator in token_limit_indicators)
+  return TOKEN_LIMIT_PATTERN.search(str(error)) is not None
 
 
 def remove_up_to_last_ai_message(
   messages: List[MessageLikeRepresentation],
 ) -> List[MessageLikeRepresentation]:
   """Remove messages from the beginning up to (and including) the last AI message."""
-  # Find the index of the last AI message
-  last_ai_index = -1
-  for i in range(len(messages) - 1, -1, -1):
-    if isinstance(messages[i], AIMessage):
-      last_ai_index = i
-      break
+  # Find the index of the last AI message, scanning from the end
+  last_ai_index = next(
+    (i for i in range(len(messages) - 1, -1, -1) if isinstance(messages[i], AIMessage)),
+    None,
+  )
 
   # If no AI message found, return original messages
-  if last_ai_index == -1:
+  if last_ai_index is None:
     return messages
 
   # Return messages after the last AI message
@@ -198,18 +272,18 @@ def get_notes_from_tool_calls(messages: List[MessageLikeRepresentation]) -> List
 
   for message in messages:
     # Extract think_tool reflections
-    if hasattr(message, "tool_calls") and message.tool_calls:
-      for tool_call in message.tool_calls:
-        if tool_call.get("name") == "think_tool":
-          args = tool_call.get("args", {})
-          if "reflection" in args:
-            notes.append(args["reflection"])
+    for tool_call in getattr(message, "tool_calls", None) or ():
+      if tool_call.get("name") == "think_tool":
+        args = tool_call.get("args", {})
+        if "reflection" in args:
+          notes.append(args["reflection"])
 
     # Extract ConductResearch findings from ToolMessage responses
-    if hasattr(message, "name") and message.name == "ConductResearch":
-      if hasattr(message, "content") and message.content:
+    if getattr(message, "name", None) == "ConductResearch":
+      content = getattr(message, "content", None)
+      if content:
         # This contains the compressed research findings
-        notes.append(str(message.content))
+        notes.append(str(content))
 
   return notes
 
@@ -233,41 +307,43 @@ def anthropic_websearch_called(message: AIMessage) -> bool:
 ##########################
 
 
-async def get_all_tools(config: RunnableConfig) -> List[BaseTool]:
-  """Get all available tools based on configuration."""
-  configurable = Configuration.from_runnable_config(config)
-  tools = []
-  existing_tool_names = set()
+# Financial Modeling Prep tools, available regardless of configuration
+FMP_TOOLS = (
+  get_company_profile,
+  get_company_profiles_batch,
+  get_stock_quote,
+  get_stock_quotes_batch,
+  get_eod_quotes,
+  get_economic_events,
+  get_treasury_rates,
+  get_income_statement,
+  get_income_statement_batch,
+  get_balance_sheet,
+  get_balance_sheet_batch,
+  get_cash_flow,
+  get_cash_flow_batch,
+  get_financial_statements,
+  get_key_metrics,
+  get_key_metrics_batch,
+  get_stock_news,
+)
 
-  # Add think_tool for strategic planning
-  tools.append(think_tool)
-  existing_tool_names.add("think_tool")
 
-  # Add ResearchComplete tool for signaling completion
-  tools.append(ResearchComplete)
-  existing_tool_names.add("ResearchComplete")
+@functools.cache
+def _tools_for_search_api(search_api: SearchAPI) -> tuple:
+  """Build the tool set for a search API once, since it never changes."""
+  # think_tool for strategic planning, ResearchComplete for signaling completion
+  tools = [think_tool, ResearchComplete]
 
   # Add search tools based on configuration
-  if configurable.search_api == SearchAPI.TAVILY:
+  if search_api == SearchAPI.TAVILY:
     tools.append(tavily_search)
-    existing_tool_names.add("tavily_search")
-
-  # Add Financial Modeling Prep tools
-  fmp_tools = [
-    get_company_profile,
-    get_stock_quote,
-    get_eod_quotes,
-    get_economic_events,
-    get_treasury_rates,
-    get_income_statement,
-    get_balance_sheet,
-    get_cash_flow,
-    get_key_metrics,
-    get_stock_news,
-  ]
 
-  for fmp_tool in fmp_tools:
-    tools.append(fmp_tool)
-    existing_tool_names.add(fmp_tool.name)
+  return (*tools, *FMP_TOOLS)
 
-  return tools
+
+async def get_all_tools(config: RunnableConfig) -> List[BaseTool]:
+  """Get all available tools based on configuration."""
+  configurable = Configuration.from_runnable_config(config)
+  # Copy so callers can extend their list without touching the cached tools
+  return list(_tools_for_search_api(configurable.search_api))
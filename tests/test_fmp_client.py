@@ -3,13 +3,104 @@
 
 import asyncio
 import os
-import sys
-from datetime import datetime, timedelta
+from collections.abc import Awaitable, Iterable
+from datetime import date, timedelta
+from typing import Any, Dict, List, TypeVar
+
+from open_deep_research.tools.fmp.client import (
+  DEFAULT_BALANCE_SHEET_FIELDS,
+  DEFAULT_CASH_FLOW_FIELDS,
+  DEFAULT_INCOME_FIELDS,
+  FMPClient,
+)
+
+T = TypeVar("T")
+
+# Symbols probed with every per-symbol endpoint
+SYMBOLS = ["AAPL", "MSFT"]
+
+# Economic events are tested over the past week
+_today = date.today()
+TODAY = _today.isoformat()
+WEEK_AGO = (_today - timedelta(days=7)).isoformat()
+
+# Maximum FMP requests in flight at once, to stay under its rate limits
+FMP_SEMAPHORE = asyncio.Semaphore(int(os.getenv("FMP_CONCURRENCY", "5")))
+
+
+async def _limited(request: Awaitable[T]) -> T:
+  """Await an FMP request under the shared concurrency limit."""
+  async with FMP_SEMAPHORE:
+    return await request
+
+
+async def _probe(client: FMPClient, symbol: str) -> List[Any]:
+  """Fetch every per-symbol endpoint for a symbol concurrently."""
+  return await asyncio.gather(
+    _limited(client.get_company_profile(symbol)),
+    _limited(client.get_quote(symbol)),
+    _limited(client.get_income_statement(symbol, "annual", 2)),
+    _limited(client.get_stock_news([symbol], 3)),
+  )
+
+
+def _print_symbol_report(
+  symbol: str,
+  profile: Dict[str, Any],
+  quote: Dict[str, Any],
+  income: List[Dict[str, Any]],
+  news: List[Dict[str, Any]],
+) -> None:
+  """Print the per-symbol endpoint results for a symbol."""
+  # Test 1: Company Profile
+  print(f"\n🔧 Testing Company Profile for {symbol}...")
+  print("✅ Company Profile: SUCCESS")
+  print(f"📄 Company: {profile.get('companyName')} ({profile.get('symbol')})")
+  print(f"📄 Industry: {profile.get('industry')}")
+  print(
+    f"📄 Market Cap: ${profile.get('mktCap'):,}" if profile.get("mktCap") else "N/A",
+  )
+
+  # Test 2: Stock Quote
+  print(f"\n🔧 Testing Stock Quote for {symbol}...")
+  print("✅ Stock Quote: SUCCESS")
+  print(f"📄 Price: ${quote.get('price')}")
+  print(f"📄 Change: {quote.get('change')} ({quote.get('changesPercentage')}%)")
+  if quote.get("volume"):
+    print(f"📄 Volume: {quote.get('volume'):,}")
+
+  # Test 3: Income Statement
+  print(f"\n🔧 Testing Income Statement for {symbol}...")
+  print("✅ Income Statement: SUCCESS")
+  if income:
+    latest = income[0]
+    print(f"📄 Latest Period: {latest.get('date')}")
+    print(
+      f"📄 Revenue: ${latest.get('revenue'):,}" if latest.get("revenue") else "N/A",
+    )
+    print(
+      f"📄 Net Income: ${latest.get('netIncome'):,}"
+      if latest.get("netIncome")
+      else "N/A",
+    )
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+  # Test 4: Stock News
+  print(f"\n🔧 Testing Stock News for {symbol}...")
+  print("✅ Stock News: SUCCESS")
+  print(f"📄 Found {len(news)} news articles for {symbol}")
+  for i, article in enumerate(news[:3], 1):
+    print(f"📄 {i}. {article.get('title', 'No title')[:60]}...")
 
-from open_deep_research.tools.fmp.client import FMPClient
+
+def _missing_default_fields(
+  rows: List[Dict[str, Any]],
+  fields: Iterable[str],
+) -> List[str]:
+  """Return the default projection fields absent from a statement payload."""
+  # Compared case-insensitively, since some fields list both the stable and
+  # v3 spellings, e.g. epsDiluted and epsdiluted
+  present = {key.lower() for row in rows for key in row}
+  return [field for field in fields if field.lower() not in present]
 
 
 async def test_client():
@@ -25,92 +116,80 @@ async def test_client():
   print("=" * 50)
 
   try:
-    client = FMPClient()
-    symbol = "AAPL"
-
-    # Test 1: Company Profile
-    print("\n🔧 Testing Company Profile...")
-    profile = await client.get_company_profile(symbol)
-    print("✅ Company Profile: SUCCESS")
-    print(f"📄 Company: {profile.get('companyName')} ({profile.get('symbol')})")
-    print(f"📄 Industry: {profile.get('industry')}")
-    print(
-      f"📄 Market Cap: ${profile.get('mktCap'):,}" if profile.get("mktCap") else "N/A",
-    )
-
-    # Test 2: Stock Quote
-    print(f"\n🔧 Testing Stock Quote for {symbol}...")
-    quote = await client.get_full_quote(symbol)
-    print("✅ Stock Quote: SUCCESS")
-    print(f"📄 Price: ${quote.get('price')}")
-    print(f"📄 Change: {quote.get('change')} ({quote.get('changesPercentage')}%)")
-
-    # Test 3: Short Quote
-    print(f"\n🔧 Testing Short Quote for {symbol}...")
-    short_quote = await client.get_short_quote(symbol)
-    print("✅ Short Quote: SUCCESS")
-    print(
-      f"📄 Price: ${short_quote.get('price')}, Volume: {short_quote.get('volume'):,}",
-    )
-
-    # Test 4: Symbol Search
-    print("\n🔧 Testing Symbol Search...")
-    search_results = await client.search_symbols("Apple", 3)
-    print("✅ Symbol Search: SUCCESS")
-    for i, result in enumerate(search_results[:3], 1):
-      print(f"📄 {i}. {result.get('name')} ({result.get('symbol')})")
-
-    # Test 5: Income Statement
-    print(f"\n🔧 Testing Income Statement for {symbol}...")
-    income = await client.get_income_statement(symbol, "annual", 2)
-    print("✅ Income Statement: SUCCESS")
-    if income:
-      latest = income[0]
-      print(f"📄 Latest Period: {latest.get('date')}")
-      print(
-        f"📄 Revenue: ${latest.get('revenue'):,}" if latest.get("revenue") else "N/A",
-      )
-      print(
-        f"📄 Net Income: ${latest.get('netIncome'):,}"
-        if latest.get("netIncome")
-        else "N/A",
+    # One client for every test so they share its pooled connection
+    async with FMPClient() as client:
+      # Symbol-independent endpoints are fetched once, alongside every
+      # symbol's probe
+      shared = asyncio.gather(
+        _limited(client.search_symbols("Apple", 3)),
+        _limited(client.get_treasury_rates()),
+        _limited(
+          client.get_economic_events(
+            WEEK_AGO,
+            TODAY,
+            impact=["High"],
+            countries=["US"],
+          ),
+        ),
       )
-
-    # Test 6: Treasury Rates
-    print("\n🔧 Testing Treasury Rates...")
-    rates = await client.get_treasury_rates()
-    print("✅ Treasury Rates: SUCCESS")
-    if rates and len(rates) > 0:
-      latest_rate = rates[0]
-      print(f"📄 Date: {latest_rate.get('date')}")
-      print(
-        f"📄 1Y: {latest_rate.get('year1')}%, 10Y: {latest_rate.get('year10')}%",
+      # Unprojected statements, to check the default fields against
+      statements = asyncio.gather(
+        _limited(client.get_income_statement(SYMBOLS[0], "annual", 1)),
+        _limited(client.get_balance_sheet(SYMBOLS[0], "annual", 1)),
+        _limited(client.get_cash_flow(SYMBOLS[0], "annual", 1)),
       )
-
-    # Test 7: Economic Events (past 7 days)
-    print("\n🔧 Testing Economic Events...")
-    today = datetime.now()
-    week_ago = today - timedelta(days=7)
-    events = await client.get_economic_events(
-      week_ago.strftime("%Y-%m-%d"),
-      today.strftime("%Y-%m-%d"),
-      impact=["High"],
-      countries=["US"],
-    )
-    print("✅ Economic Events: SUCCESS")
-    print(f"📄 Found {len(events)} high-impact US events in the past week")
-    for event in events[:3]:
-      print(
-        f"📄 {event.get('date')}: {event.get('event')} ({event.get('impact')})",
+      (
+        (search_results, rates, events),
+        (income, balance_sheet, cash_flow),
+        probes,
+      ) = await asyncio.gather(
+        shared,
+        statements,
+        asyncio.gather(*(_probe(client, symbol) for symbol in SYMBOLS)),
       )
 
-    # Test 8: Stock News
-    print("\n🔧 Testing Stock News...")
-    news = await client.get_stock_news([symbol], 3)
-    print("✅ Stock News: SUCCESS")
-    print(f"📄 Found {len(news)} news articles for {symbol}")
-    for i, article in enumerate(news[:3], 1):
-      print(f"📄 {i}. {article.get('title', 'No title')[:60]}...")
+      for symbol, results in zip(SYMBOLS, probes, strict=True):
+        _print_symbol_report(symbol, *results)
+
+      # Test 5: Symbol Search
+      print("\n🔧 Testing Symbol Search...")
+      print("✅ Symbol Search: SUCCESS")
+      for i, result in enumerate(search_results[:3], 1):
+        print(f"📄 {i}. {result.get('name')} ({result.get('symbol')})")
+
+      # Test 6: Treasury Rates
+      print("\n🔧 Testing Treasury Rates...")
+      print("✅ Treasury Rates: SUCCESS")
+      if rates and len(rates) > 0:
+        latest_rate = rates[0]
+        print(f"📄 Date: {latest_rate.get('date')}")
+        print(
+          f"📄 1Y: {latest_rate.get('year1')}%, 10Y: {latest_rate.get('year10')}%",
+        )
+
+      # Test 7: Economic Events (past 7 days)
+      print("\n🔧 Testing Economic Events...")
+      print("✅ Economic Events: SUCCESS")
+      print(f"📄 Found {len(events)} high-impact US events in the past week")
+      for event in events[:3]:
+        print(
+          f"📄 {event.get('date')}: {event.get('event')} ({event.get('impact')})",
+        )
+
+      # Test 8: Default statement fields exist in the stable payloads
+      field_reports = ["\n🔧 Testing Default Statement Fields..."]
+      for name, rows, fields in (
+        ("Income Statement", income, DEFAULT_INCOME_FIELDS),
+        ("Balance Sheet", balance_sheet, DEFAULT_BALANCE_SHEET_FIELDS),
+        ("Cash Flow", cash_flow, DEFAULT_CASH_FLOW_FIELDS),
+      ):
+        missing = _missing_default_fields(rows, fields)
+        field_reports.append(
+          f"❌ {name}: missing default fields {', '.join(missing)}"
+          if missing
+          else f"✅ {name}: all {len(fields)} default fields present",
+        )
+      print("\n".join(field_reports))
 
   except Exception as e:
     print(f"❌ Test failed: {e!s}")
@@ -123,4 +202,11 @@ async def test_client():
 
 
 if __name__ == "__main__":
-  asyncio.run(test_client())
+  try:
+    import uvloop
+  except ImportError:
+    # uvloop is not available everywhere, e.g. on Windows
+    asyncio.run(test_client())
+  else:
+    # libuv's event loop cuts per-request overhead for these network-bound runs
+    uvloop.run(test_client())
@@ -2,28 +2,84 @@
 """Test script for FMP tools."""
 
 import asyncio
-import json
+import itertools
 import os
-import sys
-from datetime import datetime, timedelta
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
 
+import orjson
+from langchain_core.tools import BaseTool
 from open_deep_research.tools.fmp.tools import (
+  close_fmp_client,
   get_balance_sheet,
   get_cash_flow,
   get_company_profile,
   get_economic_events,
-  get_full_stock_quote,
   get_income_statement,
   get_key_metrics,
-  get_short_stock_quote,
   get_stock_news,
+  get_stock_quote,
   get_treasury_rates,
   search_stock_symbols,
 )
 
+# Economic events are tested over the past week
+_today = date.today()
+TODAY = _today.isoformat()
+WEEK_AGO = (_today - timedelta(days=7)).isoformat()
+
+# Top-level entries of a tool result shown in its preview
+PREVIEW_ITEMS = 5
+
+# Maximum FMP requests in flight at once, to stay under its rate limits
+FMP_SEMAPHORE = asyncio.Semaphore(int(os.getenv("FMP_CONCURRENCY", "5")))
+
+
+def _try_pretty(result: str) -> Optional[str]:
+  """Indent a tool result's JSON for printing, or return None if it is not JSON."""
+  # Tool results are JSON followed by a short source citation, so search for
+  # it from the end instead of scanning the whole payload
+  data, _, _ = result.rpartition("\n\nSource: ")
+  try:
+    parsed = orjson.loads(data or result)
+  except orjson.JSONDecodeError:
+    return None
+
+  # Only the first few entries fit in the preview, so only indent those
+  if isinstance(parsed, list):
+    parsed = parsed[:PREVIEW_ITEMS]
+  elif isinstance(parsed, dict):
+    parsed = dict(itertools.islice(parsed.items(), PREVIEW_ITEMS))
+  return orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()
+
+
+async def _run_one(
+  test_name: str,
+  tool_func: BaseTool,
+  kwargs: Dict[str, Any],
+) -> List[str]:
+  """Run one tool test and return its report lines."""
+  lines = [f"\n🔧 Testing {test_name}..."]
+  started = time.perf_counter()
+  try:
+    async with FMP_SEMAPHORE:
+      result = await tool_func.ainvoke(kwargs)
+    lines.append(f"✅ {test_name}: SUCCESS ({time.perf_counter() - started:.2f}s)")
+
+    # Pretty print JSON if possible
+    if result.startswith("Error"):
+      lines.append(f"❌ Result: {result}")
+    elif (sample := _try_pretty(result)) is not None:
+      lines.append(f"📄 Sample data: {sample[:300]}...")
+    else:
+      lines.append(f"📄 Raw result: {result[:200]}...")
+
+  except Exception as e:
+    elapsed = time.perf_counter() - started
+    lines.append(f"❌ {test_name}: FAILED after {elapsed:.2f}s - {e!s}")
+  return lines
+
 
 async def test_tools():
   """Test all FMP tools."""
@@ -41,88 +97,58 @@ async def test_tools():
   symbol = "AAPL"
 
   tests = [
-    ("Company Profile", get_company_profile, [symbol]),
-    ("Full Stock Quote", get_full_stock_quote, [symbol]),
-    ("Short Stock Quote", get_short_stock_quote, [symbol]),
-    ("Search Symbols", search_stock_symbols, ["Apple"]),
-    ("Stock News", get_stock_news, [None, 5]),  # General news, limit 5
-    ("Income Statement", get_income_statement, [symbol, "annual", 2]),
-    ("Balance Sheet", get_balance_sheet, [symbol, "annual", 2]),
-    ("Cash Flow", get_cash_flow, [symbol, "annual", 2]),
-    ("Key Metrics", get_key_metrics, [symbol, "annual", 2]),
-    ("Treasury Rates", get_treasury_rates, []),
-  ]
-
-  # Test economic events (last 7 days)
-  today = datetime.now()
-  week_ago = today - timedelta(days=7)
-  tests.append(
+    ("Company Profile", get_company_profile, {"symbol": symbol}),
+    ("Stock Quote", get_stock_quote, {"symbol": symbol}),
+    ("Index Quote", get_stock_quote, {"symbol": "^GSPC"}),
+    ("Search Symbols", search_stock_symbols, {"query": "Apple"}),
+    # General news, limit 5
+    ("Stock News", get_stock_news, {"symbols": None, "limit": 5}),
+    (
+      "Income Statement",
+      get_income_statement,
+      {"symbol": symbol, "period": "annual", "limit": 2},
+    ),
+    (
+      "Balance Sheet",
+      get_balance_sheet,
+      {"symbol": symbol, "period": "annual", "limit": 2},
+    ),
+    ("Cash Flow", get_cash_flow, {"symbol": symbol, "period": "annual", "limit": 2}),
+    (
+      "Key Metrics",
+      get_key_metrics,
+      {"symbol": symbol, "period": "annual", "limit": 2},
+    ),
+    ("Treasury Rates", get_treasury_rates, {}),
     (
       "Economic Events",
       get_economic_events,
-      [week_ago.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")],
+      {
+        "from_date": WEEK_AGO,
+        "to_date": TODAY,
+      },
     ),
-  )
-
-  for test_name, tool_func, args in tests:
-    print(f"\n🔧 Testing {test_name}...")
-    try:
-      # Use proper LangChain tool invocation
-      if args:
-        if len(args) == 1:
-          result = await tool_func.ainvoke(
-            {"symbol": args[0]}
-            if test_name not in ["Search Symbols", "Economic Events"]
-            else {"query": args[0]}
-            if test_name == "Search Symbols"
-            else {"from_date": args[0], "to_date": args[1]}
-            if len(args) > 1
-            else {},
-          )
-        elif len(args) == 2 and test_name == "Economic Events":
-          result = await tool_func.ainvoke(
-            {"from_date": args[0], "to_date": args[1]},
-          )
-        elif len(args) == 2 and test_name == "Stock News":
-          result = await tool_func.ainvoke(
-            {"symbols": args[0], "limit": args[1]},
-          )
-        elif len(args) == 3:
-          result = await tool_func.ainvoke(
-            {"symbol": args[0], "period": args[1], "limit": args[2]},
-          )
-        else:
-          result = await tool_func.ainvoke({})
-      else:
-        result = await tool_func.ainvoke({})
-      print(f"✅ {test_name}: SUCCESS")
-
-      # Pretty print JSON if possible
-      if result.startswith("Error"):
-        print(f"❌ Result: {result}")
-      else:
-        # Try to extract and format JSON
-        try:
-          if " is " in result:
-            json_part = result.split(" is ", 1)[1].rstrip(".")
-            parsed = json.loads(json_part)
-            print(
-              f"📄 Sample data: {json.dumps(parsed, indent=2)[:300]}...",
-            )
-          else:
-            parsed = json.loads(result)
-            print(
-              f"📄 Sample data: {json.dumps(parsed, indent=2)[:300]}...",
-            )
-        except:
-          print(f"📄 Raw result: {result[:200]}...")
-
-    except Exception as e:
-      print(f"❌ {test_name}: FAILED - {e!s}")
+  ]
+
+  # The tests are independent round trips, so run them concurrently and print
+  # each report as soon as it finishes. Every tool goes through the shared FMP
+  # client, so close it once at the end
+  try:
+    for report in asyncio.as_completed([_run_one(*test) for test in tests]):
+      print("\n".join(await report))
+  finally:
+    await close_fmp_client()
 
   print("\n" + "=" * 50)
   print("🎉 FMP Tools testing complete!")
 
 
 if __name__ == "__main__":
-  asyncio.run(test_tools())
+  try:
+    import uvloop
+  except ImportError:
+    # uvloop is not available everywhere, e.g. on Windows
+    asyncio.run(test_tools())
+  else:
+    # libuv's event loop cuts per-request overhead for these network-bound runs
+    uvloop.run(test_tools())